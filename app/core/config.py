@@ -26,6 +26,9 @@ class Settings(BaseSettings):
         default="development",
         description="Application environment (development/production)",
     )
+    WORKERS: int = Field(
+        default=1, description="Uvicorn worker processes (production only)"
+    )
 
     # PostgreSQL
     POSTGRES_USER: str = Field(..., description="PostgreSQL database user")
@@ -73,59 +73,47 @@ def _format_tag_name(tag: str) -> str:
     return tag.replace("_", " ").replace("-", " ").title()
 
 
-def get_openapi_tags_from_routes(app: "FastAPI") -> list[dict]:
-    """Auto-discover all tags by scanning registered routes at OpenAPI schema generation time."""
+def _scan_routes(app: "FastAPI") -> tuple[list[dict], list[dict]]:
+    """Collect OpenAPI tags and x-tagGroups in one pass, cached until routes change."""
+    cached = getattr(app.state, "openapi_tag_cache", None)
+    if cached is not None and cached[0] == len(app.routes):
+        return cached[1], cached[2]
+
     discovered_tags: dict[str, dict] = {}
+    groups: dict[TagGroup, set[str]] = {}
 
     for route in app.routes:
         path = getattr(route, "path", "")
         tags = getattr(route, "tags", [])
 
         for tag in tags:
+            core = CORE_TAGS.get(tag)
+            group = core["group"] if core else _infer_group_from_path(path)
+            groups.setdefault(group, set()).add(tag)
+
             if tag not in discovered_tags:
-                if tag in CORE_TAGS:
-                    discovered_tags[tag] = {
-                        "name": tag,
-                        "description": CORE_TAGS[tag]["description"],
-                        "group": CORE_TAGS[tag]["group"],
-                    }
+                if core:
+                    description = core["description"]
                 else:
-                    group = _infer_group_from_path(path)
                     prefix = _GROUP_PREFIXES.get(group, "")
-                    formatted = _format_tag_name(tag)
-                    discovered_tags[tag] = {
-                        "name": tag,
-                        "description": f"{prefix} {formatted} endpoints",
-                        "group": group,
-                    }
-
-    return [
-        {"name": info["name"], "description": info["description"]}
-        for info in discovered_tags.values()
+                    description = f"{prefix} {_format_tag_name(tag)} endpoints"
+                discovered_tags[tag] = {"name": tag, "description": description}
+
+    tags = list(discovered_tags.values())
+    tag_groups = [
+        {"name": group.value, "tags": sorted(groups[group])}
+        for group in _GROUP_ORDER
+        if groups.get(group)
     ]
+    app.state.openapi_tag_cache = (len(app.routes), tags, tag_groups)
+    return tags, tag_groups
 
 
-def get_tag_groups_from_routes(app: "FastAPI") -> list[dict]:
-    """Generate x-tagGroups from auto-discovered tags, grouped by route path category."""
-    groups: dict[TagGroup, list[str]] = {}
+def get_openapi_tags_from_routes(app: "FastAPI") -> list[dict]:
+    """Auto-discover all tags by scanning registered routes at OpenAPI schema generation time."""
+    return _scan_routes(app)[0]
 
-    for route in app.routes:
-        path = getattr(route, "path", "")
-        tags = getattr(route, "tags", [])
 
-        for tag in tags:
-            group = (
-                CORE_TAGS[tag]["group"]
-                if tag in CORE_TAGS
-                else _infer_group_from_path(path)
-            )
-            if group not in groups:
-                groups[group] = []
-            if tag not in groups[group]:
-                groups[group].append(tag)
-
-    return [
-        {"name": group.value, "tags": sorted(groups[group])}
-        for group in _GROUP_ORDER
-        if group in groups and groups[group]
-    ]
+def get_tag_groups_from_routes(app: "FastAPI") -> list[dict]:
+    """Generate x-tagGroups from auto-discovered tags, grouped by route path category."""
+    return _scan_routes(app)[1]
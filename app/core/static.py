@@ -0,0 +1,104 @@
+"""In-memory static file serving.
+
+PrecomputedStaticFiles reads a static directory once, hashing each file into an
+ETag, and serves it as a pure ASGI app: no per-request stat() or file open.
+Files changed on disk are picked up on restart, so main.py uses it in
+production and keeps Starlette's StaticFiles for development.
+"""
+
+import hashlib
+import mimetypes
+import os
+from pathlib import Path
+from typing import Annotated
+
+from starlette.types import Receive, Scope, Send
+
+# (body, ETag, content-type) per path relative to the static directory
+StaticEntry = tuple[bytes, str, str]
+
+
+def _load_directory(directory: Path) -> dict[str, StaticEntry]:
+    """Read every file under directory (os.scandir walk) keyed by relative path."""
+    files: dict[str, StaticEntry] = {}
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    data = Path(entry.path).read_bytes()
+                    etag = f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+                    content_type = (
+                        mimetypes.guess_type(entry.name)[0]
+                        or "application/octet-stream"
+                    )
+                    if content_type.startswith("text/"):
+                        content_type += "; charset=utf-8"
+                    rel_path = Path(entry.path).relative_to(directory).as_posix()
+                    files[rel_path] = (data, etag, content_type)
+    return files
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check If-None-Match header (weak comparison) against an ETag."""
+    return any(
+        tag.strip().removeprefix("W/") in (etag, "*")
+        for tag in if_none_match.split(",")
+    )
+
+
+class PrecomputedStaticFiles:
+    """ASGI app serving a static directory from memory with precomputed ETags."""
+
+    def __init__(
+        self, directory: Annotated[str | Path, "Static files directory"]
+    ) -> None:
+        self.files = _load_directory(Path(directory))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+
+        if scope["method"] not in ("GET", "HEAD"):
+            await _respond(send, 405, b"Method Not Allowed", [(b"allow", b"GET, HEAD")])
+            return
+
+        # Mount sets root_path to the mount prefix; the rest is the file path
+        path = scope["path"].removeprefix(scope.get("root_path", "")).lstrip("/")
+        entry = self.files.get(path)
+        if entry is None:
+            await _respond(send, 404, b"Not Found")
+            return
+
+        data, etag, content_type = entry
+        headers = [(b"etag", etag.encode())]
+        for name, value in scope["headers"]:
+            if name == b"if-none-match" and _etag_matches(
+                value.decode("latin-1"), etag
+            ):
+                await _respond(send, 304, b"", headers, content_length=None)
+                return
+
+        headers.append((b"content-type", content_type.encode()))
+        body = data if scope["method"] == "GET" else b""
+        await _respond(send, 200, body, headers, content_length=len(data))
+
+
+async def _respond(
+    send: Send,
+    status: int,
+    body: bytes,
+    headers: list[tuple[bytes, bytes]] | None = None,
+    content_length: int | None = -1,
+) -> None:
+    """Send a complete response (content_length -1: body length, None: omit)."""
+    headers = list(headers or [])
+    if content_length is not None:
+        length = len(body) if content_length == -1 else content_length
+        headers.append((b"content-length", str(length).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+__all__ = ["PrecomputedStaticFiles"]
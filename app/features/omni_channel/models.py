@@ -8,7 +8,8 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, Column, String, UniqueConstraint
+from sqlalchemy import CheckConstraint, Column, Index, UniqueConstraint, text
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -47,6 +48,15 @@ class MessageSenderRole(str, Enum):
     ADMIN = "admin"
 
 
+def _pg_enum(enum_cls: type[Enum], name: str) -> SAEnum:
+    """Native Postgres ENUM storing member values (not names)."""
+    return SAEnum(enum_cls, name=name, values_callable=lambda e: [m.value for m in e])
+
+
+# Field descriptions live on the *Base schema models only: table-only fields are
+# never rendered in OpenAPI, so they carry comments instead of FieldInfo strings
+
+
 class ConversationBase(SQLModel):
     """Base conversation fields for schemas."""
 
@@ -82,25 +92,15 @@ class UserChannel(BaseTable, table=True):
     __tablename__ = "user_channels"
     __table_args__ = (
         UniqueConstraint("channel_id", "channel_type", name="unique_channel_per_type"),
-        CheckConstraint(
-            f"channel_type IN ({', '.join(repr(c.value) for c in ChannelType)})",
-            name="valid_channel_type",
-        ),
     )
 
     user_id: UUID = uuid_fk("users")
-    channel_id: str = Field(
-        index=True,
-        max_length=255,
-        description="External channel identifier (e.g., Telegram user ID)",
-    )
+    # External channel identifier (e.g., Telegram user ID)
+    channel_id: str = Field(index=True, max_length=255)
     channel_type: ChannelType = Field(
-        sa_column=Column(String(50), nullable=False),
-        description="Channel platform type",
-    )
-    is_primary: bool = Field(
-        default=False, description="Whether this is user's primary channel"
+        sa_column=Column(_pg_enum(ChannelType, "channel_type"), nullable=False)
     )
+    is_primary: bool = False  # Whether this is user's primary channel
 
     # Relationships
     user: "User" = Relationship(back_populates="channels")
@@ -117,25 +117,20 @@ class User(BaseTable, table=True):
         ),
     )
 
-    email: str | None = Field(
-        default=None,
-        unique=True,
-        index=True,
-        max_length=255,
-        description="User email address (unique, optional for channel-only users)",
-    )
-    name: str = Field(max_length=255, description="User display name")
-    role: str = Field(
-        max_length=50, description="User role: admin, employee, client, or ai"
-    )
+    # Optional for channel-only users
+    email: str | None = Field(default=None, unique=True, index=True, max_length=255)
+    name: str = Field(max_length=255)
+    role: str = Field(max_length=50)  # Checked against UserRole values
+    # Empty object comes from the server, not a per-instance default_factory
     profile: dict = Field(
-        default_factory=dict,
-        sa_column=Column(JSONB),
-        description="Additional user profile data stored as JSONB",
+        sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     )
 
     # Relationships
-    channels: list["UserChannel"] = Relationship(back_populates="user")
+    # Few rows per user and read wherever a user is shown: batch-load with the user
+    channels: list["UserChannel"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "selectin"}
+    )
     conversations: list["Conversation"] = Relationship(back_populates="user")
     messages: list["Message"] = Relationship(back_populates="user")
 
@@ -144,24 +139,25 @@ class Conversation(ConversationBase, BaseTable, table=True):
     """Conversation model with support for AI summaries."""
 
     __tablename__ = "conversations"
-
-    # Override channel_conversation_id to add index and unique constraint
-    channel_conversation_id: str | None = Field(
-        default=None,
-        index=True,
-        unique=True,
-        max_length=255,
-        description="External channel conversation ID",
+    __table_args__ = (
+        # Partial unique index: internal (NULL) conversations stay out of it
+        Index(
+            "ix_conversations_channel_conversation_id",
+            "channel_conversation_id",
+            unique=True,
+            postgresql_where=text("channel_conversation_id IS NOT NULL"),
+        ),
     )
 
     # Table-specific fields
-    ai_summary_updated_at: datetime | None = Field(
-        default=None, description="Timestamp when AI summary was last generated"
-    )
+    ai_summary_updated_at: datetime | None = None  # When AI summary was generated
     user_id: UUID = uuid_fk("users")
 
-    # Relationships
-    messages: list["Message"] = Relationship(back_populates="conversation")
+    # Relationships (messages are unbounded: load explicitly, in chronological order)
+    messages: list["Message"] = Relationship(
+        back_populates="conversation",
+        sa_relationship_kwargs={"order_by": "Message.created_at"},
+    )
     user: "User" = Relationship(back_populates="conversations")
 
 
@@ -170,20 +166,21 @@ class Message(MessageBase, BaseTable, table=True):
 
     __tablename__ = "messages"
     __table_args__ = (
-        CheckConstraint(
-            f"sender_role IN ({', '.join(repr(r.value) for r in MessageSenderRole)})",
-            name="valid_sender_role",
+        # Serves "recent messages in a conversation" in either sort direction
+        Index(
+            "ix_messages_conversation_id_created_at", "conversation_id", "created_at"
         ),
     )
 
-    # Table-specific fields
-    conversation_id: UUID = uuid_fk("conversations")
+    # Table-specific fields (conversation_id is covered by the composite index)
+    conversation_id: UUID = uuid_fk("conversations", index=False)
     user_id: UUID = uuid_fk("users")
 
-    # Override sender_role to add sa_column for enum handling
+    # Override sender_role to store it as a native enum
     sender_role: MessageSenderRole = Field(
-        sa_column=Column(String(50), nullable=False),
-        description="Who sent the message: client, ai, or admin",
+        sa_column=Column(
+            _pg_enum(MessageSenderRole, "message_sender_role"), nullable=False
+        )
     )
 
     # Relationships
@@ -6,7 +6,7 @@ Combined request and response models for messaging and user endpoints.
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from sqlmodel import SQLModel
 
 from ..models import ChannelType, ConversationBase, MessageBase
@@ -53,6 +53,8 @@ class UserChannelResponse(BaseModel):
     channel_type: str
     is_primary: bool
 
+    model_config = ConfigDict(frozen=True)
+
 
 class UserResponseBase(BaseModel):
     """Minimal user response for nested API responses."""
@@ -61,6 +63,9 @@ class UserResponseBase(BaseModel):
     name: str
     role: str
 
+    # Response-only: built from ORM rows and serialized, never mutated
+    model_config = ConfigDict(frozen=True)
+
 
 class UserDetailResponse(UserResponseBase):
     """Detailed user response with all public fields."""
@@ -119,13 +124,12 @@ class InternalModeBase(SQLModel):
 class MessageCreate(MessageBase, ChannelModeBase, InternalModeBase):
     """Request schema for creating a message."""
 
-    @field_validator("content")
-    @classmethod
-    def validate_content_not_empty(cls, v: str) -> str:
-        """Ensure content is not just whitespace."""
-        if not v.strip():
-            raise ValueError("Content cannot be empty or whitespace only")
-        return v
+    # Non-whitespace check runs in pydantic-core instead of a Python validator
+    content: str = Field(
+        max_length=10000,
+        pattern=r"\S",
+        description="Message text content (not empty or whitespace only)",
+    )
 
     @model_validator(mode="after")
     def validate_mode_parameters(self) -> "MessageCreate":
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from sqlmodel import SQLModel
 
 from fastapi import Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -39,6 +39,10 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Built once so every insert hits the same entry in SQLAlchemy's compiled cache;
+# RETURNING brings back server-generated id/timestamps without a refresh SELECT
+_INSERT_MESSAGE = insert(Message).returning(Message)
+
 
 def load_prompt(filename: str) -> str | None:
     """Load prompt from resources/prompts directory."""
@@ -159,7 +163,6 @@ class MessagingService:
             email=None,
             name=f"{channel_type.value.capitalize()} User {channel_id[-4:]}",
             role=UserRole.CLIENT.value,
-            profile={},
         )
         self.session.add(user)
         await self.session.flush()
@@ -302,22 +305,48 @@ class MessagingService:
             resolved_user_id = user_id
             resolved_conversation_id = conversation_id
 
-        message = Message(
-            conversation_id=resolved_conversation_id,
-            user_id=resolved_user_id,
-            sender_role=sender_role,
-            content=content,
+        result = await self.session.scalars(
+            _INSERT_MESSAGE,
+            [
+                {
+                    "conversation_id": resolved_conversation_id,
+                    "user_id": resolved_user_id,
+                    "sender_role": sender_role,
+                    "content": content,
+                }
+            ],
         )
-        self.session.add(message)
+        message = result.one()
 
-        conversation.updated_at = datetime.now(UTC)
-        self.session.add(conversation)
+        # Bump by the database clock, like create_messages and the column's onupdate
+        await self.session.execute(
+            update(Conversation)
+            .where(Conversation.id == resolved_conversation_id)
+            .values(updated_at=func.now())
+        )
 
         await self.session.commit()
-        await self.session.refresh(message)
 
         return message
 
+    async def create_messages(self, messages: list[dict[str, Any]]) -> None:
+        """
+        Bulk insert messages for batch ingest in a single multi-row INSERT.
+
+        Each dict holds conversation_id, user_id, sender_role and content.
+        Touched conversations get updated_at bumped in one UPDATE.
+        """
+        if not messages:
+            return
+
+        await self.session.execute(insert(Message), messages)
+        await self.session.execute(
+            update(Conversation)
+            .where(Conversation.id.in_({m["conversation_id"] for m in messages}))
+            .values(updated_at=func.now())
+        )
+        await self.session.commit()
+
     async def get_conversation_messages(
         self,
         conversation_id: UUID | None = None,
@@ -403,11 +432,7 @@ class MessagingService:
 
         formatted_conversations = []
         for conv in conversations:
-            last_message = (
-                max(conv.messages, key=lambda m: m.created_at)
-                if conv.messages
-                else None
-            )
+            last_message = conv.messages[-1] if conv.messages else None
 
             user_channels = sorted(
                 conv.user.channels, key=lambda c: c.is_primary, reverse=True
@@ -466,11 +491,7 @@ class MessagingService:
 
         formatted_conversations = []
         for conv in conversations:
-            last_message = (
-                max(conv.messages, key=lambda m: m.created_at)
-                if conv.messages
-                else None
-            )
+            last_message = conv.messages[-1] if conv.messages else None
 
             user_channels = sorted(
                 conv.user.channels, key=lambda c: c.is_primary, reverse=True
@@ -41,46 +41,24 @@ class VoiceSession(BaseTable, table=True):
     __tablename__ = "voice_sessions"
 
     # Generic identifiers (not provider-specific)
-    external_session_id: str = Field(
-        index=True,
-        unique=True,
-        description="External ID (room name, call ID, etc.)",
-    )
-    provider_type: str = Field(
-        sa_column=Column(String(50)),
-        description="Provider type (livekit, telnyx, etc.)",
-    )
+    # External ID (room name, call ID, etc.)
+    external_session_id: str = Field(index=True, unique=True)
+    # Provider type (livekit, telnyx, etc.)
+    provider_type: str = Field(sa_column=Column(String(50)))
 
     # Session metadata
-    session_type: VoiceSessionType = Field(
-        sa_column=Column(String(50)),
-        description="Type of session (web, phone_inbound, phone_outbound)",
-    )
+    session_type: VoiceSessionType = Field(sa_column=Column(String(50)))
     status: VoiceSessionStatus = Field(
-        default=VoiceSessionStatus.INITIATED,
-        sa_column=Column(String(50)),
-        description="Current session status",
+        default=VoiceSessionStatus.INITIATED, sa_column=Column(String(50))
     )
 
-    # Phone details (for telephony sessions)
-    from_number: str | None = Field(
-        default=None,
-        description="Caller phone number (E.164 format)",
-    )
-    to_number: str | None = Field(
-        default=None,
-        description="Called phone number (E.164 format)",
-    )
+    # Phone details (for telephony sessions, E.164 format)
+    from_number: str | None = None
+    to_number: str | None = None
 
     # Timing (duration can be calculated from started_at and ended_at)
-    started_at: datetime | None = Field(
-        default=None,
-        description="When session became active",
-    )
-    ended_at: datetime | None = Field(
-        default=None,
-        description="When session ended",
-    )
+    started_at: datetime | None = None  # When session became active
+    ended_at: datetime | None = None
 
     # Relationships
     messages: list["VoiceMessage"] = Relationship(back_populates="session")
@@ -112,14 +90,8 @@ class VoiceMessage(BaseTable, table=True):
     session_id: UUID = uuid_fk("voice_sessions")
 
     # Message content
-    role: VoiceMessageRole = Field(
-        sa_column=Column(String(50)),
-        description="Message sender role (user or assistant)",
-    )
-    content: str = Field(
-        sa_column=Column(Text),
-        description="Message text content",
-    )
+    role: VoiceMessageRole = Field(sa_column=Column(String(50)))
+    content: str = Field(sa_column=Column(Text))
 
     # Relationships
     session: VoiceSession = Relationship(back_populates="messages")
@@ -1,24 +1,158 @@
 """LangChain LLM provider implementation.
 
 Implements LLMProvider using LangChain's universal initialization.
+
+Pass cache=True to create_model to reuse identical completions via LangChain's
+LLM cache; deterministic (temperature=0) workloads benefit most.
 """
 
-from collections.abc import AsyncIterator
-from typing import Annotated
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from functools import lru_cache, partial
+from typing import Annotated, Any
 
-import httpx
 from langchain.chat_models import init_chat_model
+from langchain_core.caches import BaseCache, InMemoryCache
 from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import RunnableConfig
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
 from app.lib.llm.base import LLMProvider
-from app.lib.llm.config import InvocationMode, Model, ModelProvider
+from app.lib.llm.config import (
+    MODEL_CONFIG,
+    PROVIDER_MAX_CONCURRENCY,
+    InvocationMode,
+    Model,
+    ModelProvider,
+)
+from app.lib.llm.rate_limit import estimate_tokens, get_limiter
 from app.lib.llm.settings import llm_settings  # noqa: F401 - loads env into os.environ
+from app.lib.llm.utils import create_http_client
 
 # OpenRouter configuration
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+# Process-wide LangChain cache used when create_model is called with cache=True
+_llm_cache = InMemoryCache()
+
+# BATCH concurrency when the provider can't be resolved from PROVIDER_MAX_CONCURRENCY
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@lru_cache(maxsize=128)
+def _build_chat_model(
+    model: str,
+    model_provider: str | None,
+    temperature: float,
+    max_retries: int,
+    tools: tuple | None,
+    schema: type[BaseModel] | None,
+    extra: tuple[tuple[str, Any], ...],
+) -> BaseChatModel:
+    """Build chat model with optional tools and structured output (memoized)."""
+    http_client = create_http_client(timeout=300.0)
+
+    # OpenRouter uses ChatOpenAI with custom base_url
+    if model_provider == ModelProvider.OPENROUTER.value:
+        chat_model = ChatOpenAI(
+            model=model,
+            api_key=llm_settings.OPENROUTER_API_KEY,
+            base_url=OPENROUTER_BASE_URL,
+            temperature=temperature,
+            max_retries=max_retries,
+            http_async_client=http_client,
+            **dict(extra),
+        )
+    else:
+        chat_model = init_chat_model(
+            model=model,
+            model_provider=model_provider,
+            temperature=temperature,
+            max_retries=max_retries,
+            http_async_client=http_client,
+            **dict(extra),
+        )
+
+    if tools:
+        chat_model = chat_model.bind_tools(list(tools))
+
+    if schema:
+        method = "function_calling" if tools else None
+        chat_model = (
+            chat_model.with_structured_output(schema, method=method)
+            if method
+            else chat_model.with_structured_output(schema)
+        )
+
+    return chat_model
+
+
+def _enum_value(value: Any) -> Any:
+    """Unwrap enum members (Model, ModelProvider) to their raw value."""
+    return getattr(value, "value", value)
+
+
+def _is_hashable(value: Any) -> bool:
+    """Check if value can be used as a cache key."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class _ResponseCache:
+    """In-process LRU cache of exact-match model responses with a TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get unexpired cached response and mark it as recently used."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache response, evicting the least recently used entry when full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._data.clear()
+
+
+# Deterministic (temperature=0) INVOKE responses keyed by model config + prompt digest
+_response_cache = _ResponseCache()
+
+# Upstream calls in flight per cache key, shared by identical concurrent requests
+_inflight: dict[Hashable, asyncio.Task] = {}
+
+
+def _finish_inflight(key: Hashable, task: asyncio.Task) -> None:
+    """Cache a successful shared call and release its in-flight slot."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # exception() also marks failures as retrieved when every waiter was cancelled
+    if not task.cancelled() and task.exception() is None:
+        _response_cache.set(key, task.result())
+
 
 class LangChainLLMProvider(LLMProvider):
     """LangChain implementation of the LLM provider."""
@@ -34,57 +168,54 @@ class LangChainLLMProvider(LLMProvider):
         schema: Annotated[
             type[BaseModel] | None, "Pydantic model for structured output"
         ] = None,
+        cache: Annotated[
+            BaseCache | bool | None, "LangChain completion cache (True: in-memory)"
+        ] = None,
         **kwargs,
     ) -> BaseChatModel:
-        """Create chat model instance with optional tools and structured output."""
-        model_value = model.value if isinstance(model, Model) else model
-        provider_value = (
-            model_provider.value
-            if isinstance(model_provider, ModelProvider)
-            else model_provider
-        )
-
-        # Force connection close after each request
-        http_client = httpx.AsyncClient(
-            limits=httpx.Limits(max_connections=1, max_keepalive_connections=0),
-            timeout=httpx.Timeout(300.0),
-        )
+        """Create chat model instance with optional tools and structured output.
 
+        Instances are memoized per configuration; unhashable tools or kwargs
+        (e.g. callback handlers) bypass the cache.
+        """
+        model_value = _enum_value(model)
+        provider_value = _enum_value(model_provider)
         max_retries = kwargs.pop("max_retries", 2)
+        if cache is not None:
+            kwargs["cache"] = _llm_cache if cache is True else cache
 
-        # OpenRouter uses ChatOpenAI with custom base_url
-        if provider_value == ModelProvider.OPENROUTER.value:
-            chat_model = ChatOpenAI(
-                model=model_value,
-                api_key=llm_settings.OPENROUTER_API_KEY,
-                base_url=OPENROUTER_BASE_URL,
-                temperature=temperature,
-                max_retries=max_retries,
-                http_async_client=http_client,
-                **kwargs,
-            )
-        else:
-            chat_model = init_chat_model(
-                model=model_value,
-                model_provider=provider_value,
-                temperature=temperature,
-                max_retries=max_retries,
-                http_async_client=http_client,
-                **kwargs,
-            )
-
-        if tools:
-            chat_model = chat_model.bind_tools(tools)
-
-        if schema:
-            method = "function_calling" if tools else None
-            chat_model = (
-                chat_model.with_structured_output(schema, method=method)
-                if method
-                else chat_model.with_structured_output(schema)
-            )
-
-        return chat_model
+        args = (
+            model_value,
+            provider_value,
+            temperature,
+            max_retries,
+            tuple(tools) if tools else None,
+            schema,
+            tuple(sorted(kwargs.items())),
+        )
+        if _is_hashable(args):
+            return _build_chat_model(*args)
+        return _build_chat_model.__wrapped__(*args)
+
+    def _resolve_model(
+        self,
+        model: BaseChatModel | None,
+        model_name: Model | str | None,
+        model_provider: ModelProvider | str | None,
+        temperature: float,
+        **kwargs,
+    ) -> BaseChatModel:
+        """Return the given model or the memoized one built by create_model."""
+        if model is not None:
+            return model
+        if model_name is None:
+            raise ValueError("Must provide either 'model' or 'model_name'")
+        return self.create_model(
+            model_name,
+            model_provider=model_provider,
+            temperature=temperature,
+            **kwargs,
+        )
 
     async def invoke_model(
         self,
@@ -100,39 +231,278 @@ class LangChainLLMProvider(LLMProvider):
             ModelProvider | str | None, "Provider identifier"
         ] = None,
         temperature: Annotated[float, "Sampling temperature (0.0 to 1.0)"] = 0.0,
+        max_concurrency: Annotated[
+            int | None, "Max parallel calls in BATCH mode (default: provider limit)"
+        ] = None,
+        response_cache: Annotated[
+            bool, "Reuse exact-match INVOKE responses when temperature is 0"
+        ] = True,
+        **kwargs,
+    ) -> str | list[str] | AsyncIterator[str]:
+        """Invoke LLM with specified execution mode.
+
+        Deterministic INVOKE calls built from model_name are served from an
+        in-process TTL/LRU cache on exact prompt match, and identical
+        concurrent calls share a single upstream request.
+        """
+        handler = _MODE_HANDLERS.get(mode)
+        if handler is None:
+            raise ValueError(f"{mode!r} is not a valid {InvocationMode.__name__}")
+
+        call = partial(
+            self._call_handler,
+            handler,
+            prompt,
+            model,
+            model_name,
+            model_provider,
+            temperature,
+            max_concurrency,
+            **kwargs,
+        )
+        if not (
+            response_cache
+            and handler is _invoke
+            and model is None
+            and temperature == 0.0
+            and isinstance(prompt, str)
+        ):
+            return await call()
+
+        cache_key = (
+            model_name,
+            model_provider,
+            tuple(sorted(kwargs.items())),
+            hashlib.blake2b(prompt.encode(), digest_size=16).digest(),
+        )
+        if not _is_hashable(cache_key):
+            return await call()
+        if (cached := _response_cache.get(cache_key)) is not None:
+            return cached
+
+        # Singleflight: identical concurrent requests await one upstream call
+        task = _inflight.get(cache_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(call())
+            _inflight[cache_key] = task
+            task.add_done_callback(partial(_finish_inflight, cache_key))
+        return await asyncio.shield(task)
+
+    async def _call_handler(
+        self,
+        handler: Callable[..., Awaitable],
+        prompt: str | list[str],
+        model: BaseChatModel | None,
+        model_name: Model | str | None,
+        model_provider: ModelProvider | str | None,
+        temperature: float,
+        max_concurrency: int | None,
         **kwargs,
     ) -> str | list[str] | AsyncIterator[str]:
-        """Invoke LLM with specified execution mode."""
-        if model is None:
-            if model_name is None:
-                raise ValueError("Must provide either 'model' or 'model_name'")
-            model = self.create_model(model_name, model_provider, temperature, **kwargs)
-
-        mode_enum = InvocationMode(mode) if isinstance(mode, str) else mode
-
-        if mode_enum == InvocationMode.INVOKE:
-            if isinstance(prompt, list):
-                raise ValueError(
-                    "INVOKE mode requires a single prompt string, not a list"
-                )
+        """Resolve the model and run a mode handler (it holds the provider limiter)."""
+        model = self._resolve_model(
+            model, model_name, model_provider, temperature, **kwargs
+        )
+
+        config: RunnableConfig = {
+            "max_concurrency": max_concurrency
+            or _resolve_max_concurrency(model_name, model_provider)
+        }
+        provider = _resolve_provider(model_name, model_provider)
+        return await handler(model, prompt, config, provider)
+
+    def stream_model(
+        self,
+        prompt: Annotated[str, "Single prompt"],
+        model: Annotated[BaseChatModel | None, "Pre-configured model instance"] = None,
+        model_name: Annotated[
+            Model | str | None, "Model identifier (required if model not provided)"
+        ] = None,
+        model_provider: Annotated[
+            ModelProvider | str | None, "Provider identifier"
+        ] = None,
+        temperature: Annotated[float, "Sampling temperature (0.0 to 1.0)"] = 0.0,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Stream LLM response chunks without awaiting an intermediate coroutine."""
+        if isinstance(prompt, list):
+            raise ValueError("STREAM mode requires a single prompt string, not a list")
+        model = self._resolve_model(
+            model, model_name, model_provider, temperature, **kwargs
+        )
+
+        return _astream_content(
+            model, prompt, None, _resolve_provider(model_name, model_provider)
+        )
+
+    def invoke_model_iter(
+        self,
+        prompts: Annotated[list[str], "Prompts to invoke concurrently"],
+        model: Annotated[BaseChatModel | None, "Pre-configured model instance"] = None,
+        model_name: Annotated[
+            Model | str | None, "Model identifier (required if model not provided)"
+        ] = None,
+        model_provider: Annotated[
+            ModelProvider | str | None, "Provider identifier"
+        ] = None,
+        temperature: Annotated[float, "Sampling temperature (0.0 to 1.0)"] = 0.0,
+        max_concurrency: Annotated[
+            int | None, "Max parallel calls (default: provider limit)"
+        ] = None,
+        **kwargs,
+    ) -> AsyncIterator[tuple[int, str]]:
+        """Yield (index, content) pairs in completion order instead of awaiting the whole batch."""
+        if not isinstance(prompts, list):
+            raise ValueError("BATCH mode requires a list of prompts")
+        model = self._resolve_model(
+            model, model_name, model_provider, temperature, **kwargs
+        )
+
+        limit = max_concurrency or _resolve_max_concurrency(model_name, model_provider)
+        return _ainvoke_as_completed(
+            model, prompts, limit, _resolve_provider(model_name, model_provider)
+        )
+
+
+def _resolve_provider(
+    model_name: Model | str | None, model_provider: ModelProvider | str | None
+) -> ModelProvider | str | None:
+    """Resolve provider from the explicit value or the model's MODEL_CONFIG entry."""
+    if model_provider is None and model_name in MODEL_CONFIG:
+        return MODEL_CONFIG[model_name].provider
+    return model_provider
+
+
+def _resolve_max_concurrency(
+    model_name: Model | str | None, model_provider: ModelProvider | str | None
+) -> int:
+    """Resolve BATCH concurrency from the provider's limit in PROVIDER_MAX_CONCURRENCY."""
+    provider = _resolve_provider(model_name, model_provider)
+    return PROVIDER_MAX_CONCURRENCY.get(provider, DEFAULT_MAX_CONCURRENCY)
+
+
+def _provider_slot(
+    provider: ModelProvider | str | None,
+    prompts: list[str],
+) -> AbstractAsyncContextManager:
+    """Acquire the shared provider rate limiter; no-op for unconfigured providers.
+
+    Hold one slot per upstream request, for as long as that request is open.
+    """
+    if provider not in PROVIDER_MAX_CONCURRENCY:
+        return nullcontext()
+    return get_limiter(provider).acquire(estimate_tokens(prompts))
+
+
+# -----------------------------------------------------------------------------
+# Invocation Mode Handlers
+# -----------------------------------------------------------------------------
+
+
+async def _invoke(
+    model: BaseChatModel,
+    prompt: str | list[str],
+    config: RunnableConfig | None,
+    provider: ModelProvider | str | None = None,
+) -> str:
+    """Invoke model with a single prompt."""
+    if isinstance(prompt, list):
+        raise ValueError("INVOKE mode requires a single prompt string, not a list")
+    async with _provider_slot(provider, [prompt]):
+        response = await model.ainvoke(prompt, config)
+    return response.content
+
+
+async def _batch(
+    model: BaseChatModel,
+    prompt: str | list[str],
+    config: RunnableConfig | None,
+    provider: ModelProvider | str | None = None,
+) -> list[str]:
+    """Invoke model with a list of prompts, bounded by config's max_concurrency.
+
+    Each prompt is its own ainvoke holding its own limiter slot (abatch would
+    run max_concurrency requests under a single slot).
+    """
+    if not isinstance(prompt, list):
+        raise ValueError("BATCH mode requires a list of prompts")
+    max_concurrency = (config or {}).get("max_concurrency") or DEFAULT_MAX_CONCURRENCY
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: str) -> str:
+        async with semaphore, _provider_slot(provider, [item]):
+            response = await model.ainvoke(item, config)
+        return response.content
+
+    if len(prompt) == 1:  # Skip task fan-out for a single prompt
+        return [await run(prompt[0])]
+    tasks = [asyncio.create_task(run(item)) for item in prompt]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:  # A prompt failed or the caller was cancelled
+            task.cancel()
+
+
+async def _stream(
+    model: BaseChatModel,
+    prompt: str | list[str],
+    config: RunnableConfig | None,
+    provider: ModelProvider | str | None = None,
+) -> AsyncIterator[str]:
+    """Stream model response for a single prompt."""
+    if isinstance(prompt, list):
+        raise ValueError("STREAM mode requires a single prompt string, not a list")
+    return _astream_content(model, prompt, config, provider)
+
+
+async def _astream_content(
+    model: BaseChatModel,
+    prompt: str,
+    config: RunnableConfig | None,
+    provider: ModelProvider | str | None = None,
+) -> AsyncIterator[str]:
+    """Yield non-empty content chunks, holding a limiter slot for the whole stream."""
+    async with _provider_slot(provider, [prompt]):
+        stream = model.astream(prompt, config)
+        try:
+            async for chunk in stream:
+                content = chunk.content
+                if content:
+                    yield content
+        finally:
+            await stream.aclose()  # Propagate early exit to the provider's HTTP stream
+
+
+async def _ainvoke_as_completed(
+    model: BaseChatModel,
+    prompts: list[str],
+    max_concurrency: int,
+    provider: ModelProvider | str | None = None,
+) -> AsyncIterator[tuple[int, str]]:
+    """Invoke prompts concurrently and yield (index, content) as each completes."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(idx: int, prompt: str) -> tuple[int, str]:
+        async with semaphore, _provider_slot(provider, [prompt]):
             response = await model.ainvoke(prompt)
-            return response.content
-
-        elif mode_enum == InvocationMode.BATCH:
-            if not isinstance(prompt, list):
-                raise ValueError("BATCH mode requires a list of prompts")
-            responses = await model.abatch(prompt)
-            return [r.content for r in responses]
-
-        elif mode_enum == InvocationMode.STREAM:
-            if isinstance(prompt, list):
-                raise ValueError(
-                    "STREAM mode requires a single prompt string, not a list"
-                )
-
-            async def stream_generator() -> AsyncIterator[str]:
-                async for chunk in model.astream(prompt):
-                    if chunk.content:
-                        yield chunk.content
-
-            return stream_generator()
+        return idx, response.content
+
+    tasks = [asyncio.create_task(run(i, p)) for i, p in enumerate(prompts)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:  # Client disconnected or a prompt failed
+            task.cancel()
+
+
+# InvocationMode is a str enum, so plain strings ("invoke") hit the same keys
+_MODE_HANDLERS: dict[
+    str,
+    Callable[[BaseChatModel, str | list[str], RunnableConfig | None, Any], Awaitable],
+] = {
+    InvocationMode.INVOKE: _invoke,
+    InvocationMode.BATCH: _batch,
+    InvocationMode.STREAM: _stream,
+}
@@ -1,6 +1,9 @@
 """Telnyx telephony provider implementation."""
 
-from functools import lru_cache
+import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
 from typing import Annotated
 
 from telnyx import AsyncTelnyx
@@ -9,6 +12,10 @@ from app.integrations.telnyx.client import get_telnyx_client
 from app.integrations.telnyx.config import telnyx_settings
 from app.lib.telephony.base import TelephonyProvider
 
+# How long repeats of an idempotency key get the dialed call's ID instead of a new dial
+DIAL_IDEMPOTENCY_TTL = 300.0
+DIAL_IDEMPOTENCY_MAX_KEYS = 1024
+
 
 class TelnyxTelephonyProvider(TelephonyProvider):
     """Telnyx implementation of TelephonyProvider.
@@ -22,14 +29,45 @@ class TelnyxTelephonyProvider(TelephonyProvider):
     ) -> None:
         """Initialize provider with Telnyx client."""
         self.client = client or get_telnyx_client()
+        # Dials in flight per idempotency key, shared by concurrent retries
+        self._inflight: dict[str, asyncio.Task[str]] = {}
+        # Idempotency key -> (expires_at, call control ID) of completed dials
+        self._dialed: OrderedDict[str, tuple[float, str]] = OrderedDict()
 
     async def initiate_call(
         self,
         to_number: Annotated[str, "Destination phone number (E.164 format)"],
         from_number: Annotated[str, "Caller ID phone number (E.164 format)"],
         webhook_url: Annotated[str, "URL to receive call events"],
+        idempotency_key: Annotated[
+            str | None, "Key that makes retries dial at most once"
+        ] = None,
     ) -> str:
         """Initiate an outbound call. Returns call control ID."""
+        if idempotency_key is None:
+            return await self._dial(to_number, from_number, webhook_url)
+
+        # Telnyx scopes command_id to an existing call, so dials are deduped here
+        if (call_control_id := self._dialed_call(idempotency_key)) is not None:
+            return call_control_id
+
+        # Same key in flight: await that dial
+        task = self._inflight.get(idempotency_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(
+                self._dial(to_number, from_number, webhook_url)
+            )
+            self._inflight[idempotency_key] = task
+            task.add_done_callback(partial(self._finish_inflight, idempotency_key))
+        return await asyncio.shield(task)
+
+    async def _dial(
+        self,
+        to_number: str,
+        from_number: str,
+        webhook_url: str,
+    ) -> str:
+        """Dial via Telnyx."""
         response = await self.client.calls.dial(
             connection_id=telnyx_settings.TELNYX_SIP_TRUNK_ID,
             to=to_number,
@@ -38,12 +76,39 @@ class TelnyxTelephonyProvider(TelephonyProvider):
         )
         return response.data.call_control_id
 
+    def _dialed_call(self, key: str) -> str | None:
+        """Get the call control ID dialed for key, None if unknown or expired."""
+        entry = self._dialed.get(key)
+        if entry is None:
+            return None
+        expires_at, call_control_id = entry
+        if expires_at < time.monotonic():
+            del self._dialed[key]
+            return None
+        return call_control_id
+
+    def _finish_inflight(self, key: str, task: asyncio.Task[str]) -> None:
+        """Release a finished dial's in-flight slot and remember its call ID."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # exception() also marks failures as retrieved when every waiter was cancelled
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._dialed[key] = (time.monotonic() + DIAL_IDEMPOTENCY_TTL, task.result())
+        self._dialed.move_to_end(key)
+        if len(self._dialed) > DIAL_IDEMPOTENCY_MAX_KEYS:
+            self._dialed.popitem(last=False)
+
     async def answer_call(
         self,
         call_id: Annotated[str, "Call control ID from Telnyx"],
+        idempotency_key: Annotated[
+            str | None, "Key that makes retries answer at most once"
+        ] = None,
     ) -> None:
         """Answer an incoming call."""
-        await self.client.calls.actions.answer(call_id)
+        extra = {"command_id": idempotency_key} if idempotency_key else {}
+        await self.client.calls.actions.answer(call_id, **extra)
 
     async def hangup_call(
         self,
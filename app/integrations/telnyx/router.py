@@ -1,6 +1,8 @@
 """Telnyx API endpoints for call management."""
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
+
+from fastapi import APIRouter, Header, HTTPException
 
 from app.integrations.telnyx.config import telnyx_settings
 from app.integrations.telnyx.provider import get_telephony_provider
@@ -14,8 +16,11 @@ router = APIRouter()
 
 
 @router.post("/calls", response_model=InitiateCallResponse)
-async def initiate_call(request: InitiateCallRequest) -> InitiateCallResponse:
-    """Initiate an outbound phone call."""
+async def initiate_call(
+    request: InitiateCallRequest,
+    idempotency_key: Annotated[str | None, Header()] = None,
+) -> InitiateCallResponse:
+    """Initiate an outbound phone call (Idempotency-Key header makes retries safe)."""
     if not telnyx_settings.TELNYX_SIP_TRUNK_ID:
         raise HTTPException(
             status_code=503,
@@ -29,6 +34,7 @@ async def initiate_call(request: InitiateCallRequest) -> InitiateCallResponse:
         to_number=request.to_number,
         from_number=request.from_number or telnyx_settings.TELNYX_PHONE_NUMBER,
         webhook_url=webhook_url,
+        idempotency_key=idempotency_key,
     )
 
     return InitiateCallResponse(
@@ -38,10 +44,13 @@ async def initiate_call(request: InitiateCallRequest) -> InitiateCallResponse:
 
 
 @router.post("/calls/{call_control_id}/answer")
-async def answer_call(call_control_id: str) -> dict:
+async def answer_call(
+    call_control_id: str,
+    idempotency_key: Annotated[str | None, Header()] = None,
+) -> dict:
     """Answer an incoming call."""
     provider = get_telephony_provider()
-    await provider.answer_call(call_control_id)
+    await provider.answer_call(call_control_id, idempotency_key=idempotency_key)
     return {"status": CallActionStatus.ANSWERED.value}
 
 
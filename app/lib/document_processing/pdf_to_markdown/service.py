@@ -8,6 +8,7 @@ import logging
 import os
 import re
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 
@@ -65,11 +66,13 @@ _SHORT_WORDS = frozenset(
     "see she the too two use was who why yes yet you and but "
     "dob ssn dds vr ed yr mo dr mr ms md pa rn aka etc inc ltd llc".split()
 )
+_SHORT_WORD = re.compile(r"^[a-zA-Z]{1,3}$")
 
 
 # =============================================================================
 # Garbage filtering
 # =============================================================================
+@lru_cache(maxsize=4096)  # Running headers/footers repeat on every page
 def _is_garbage_line(line: str) -> bool:
     """Detect garbage lines from OCR/scanned PDFs."""
     s = line.strip()
@@ -84,8 +87,10 @@ def _is_garbage_line(line: str) -> bool:
             return True
 
     # Short word check (1-3 letters)
-    if re.match(r"^[a-zA-Z]{1,3}$", s) and s.lower() not in _SHORT_WORDS:
-        return True
+    if _SHORT_WORD.match(s):
+        word = s if s.islower() else s.lower()  # Skip allocation for lowercase
+        if word not in _SHORT_WORDS:
+            return True
 
     # High symbol ratio (>60% non-alphanumeric)
     if len(s) > 8 and sum(c.isalnum() for c in s) / len(s) < 0.4:
@@ -179,32 +184,29 @@ def convert_pdf_to_markdown(
     output_path: Annotated[str | Path | None, "Path to save output markdown"] = None,
 ) -> Annotated[str, "Markdown with bookmark headers"]:
     """Convert PDF to markdown with bookmark headers at page boundaries."""
-    doc = pymupdf.open(str(pdf_path))
-
-    bookmarks_by_page = extract_bookmarks(doc)
-    logger.info(f"Extracted {sum(len(b) for b in bookmarks_by_page.values())} bookmarks from {doc.page_count} pages")
-
-    page_chunks = pymupdf4llm.to_markdown(
-        doc, page_chunks=True, write_images=False, table_strategy=None,
-        ignore_graphics=True, ignore_images=True, ignore_code=True,
-        fontsize_limit=3, graphics_limit=500, margins=0, force_text=True, use_glyphs=True,
-    )
-
-    # Build markdown
-    parts = []
-    if doc.metadata.get("title"):
-        parts.append(f"# {doc.metadata['title']}\n\n")
-
-    total = doc.page_count
-    for i, chunk in enumerate(page_chunks):
-        page_num = i + 1
-        if page_num in bookmarks_by_page:
-            parts.append(_bookmarks_to_markdown(bookmarks_by_page[page_num]))
-        if page_text := chunk.get("text", "").strip():
-            parts.append(f"---\n**Page {page_num} of {total}**\n\n")
-            parts.append(page_text + "\n\n")
-
-    doc.close()
+    with pymupdf.open(str(pdf_path)) as doc:
+        bookmarks_by_page = extract_bookmarks(doc)
+        logger.info(f"Extracted {sum(len(b) for b in bookmarks_by_page.values())} bookmarks from {doc.page_count} pages")
+
+        page_chunks = pymupdf4llm.to_markdown(
+            doc, page_chunks=True, write_images=False, table_strategy=None,
+            ignore_graphics=True, ignore_images=True, ignore_code=True,
+            fontsize_limit=3, graphics_limit=500, margins=0, force_text=True, use_glyphs=True,
+        )
+
+        # Build markdown
+        parts = []
+        if doc.metadata.get("title"):
+            parts.append(f"# {doc.metadata['title']}\n\n")
+
+        total = doc.page_count
+        for i, chunk in enumerate(page_chunks):
+            page_num = i + 1
+            if page_num in bookmarks_by_page:
+                parts.append(_bookmarks_to_markdown(bookmarks_by_page[page_num]))
+            if page_text := chunk.get("text", "").strip():
+                parts.append(f"---\n**Page {page_num} of {total}**\n\n")
+                parts.append(page_text + "\n\n")
 
     # Post-process
     md = "".join(parts)
@@ -227,9 +229,8 @@ def get_document_sections(
     pdf_path: Annotated[str | Path, "Path to PDF file"],
 ) -> Annotated[list[dict], "Section dicts with level, title, page"]:
     """Extract section structure from PDF bookmarks."""
-    doc = pymupdf.open(str(pdf_path))
-    toc = doc.get_toc()
-    doc.close()
+    with pymupdf.open(str(pdf_path)) as doc:
+        toc = doc.get_toc()
     return [
         {"level": level, "title": title, "page": page}
         for level, title, page in toc
@@ -2,41 +2,110 @@
 
 Provides a unified interface for LLM operations with runtime provider selection.
 Configure the provider via LLM_PROVIDER environment variable.
+
+Exports resolve lazily (PEP 562) so importing one name doesn't pull in
+LangChain, FastAPI, and the embeddings client.
 """
 
-from app.lib.llm.base import LLMProvider
-from app.lib.llm.config import (
-    InvocationMode,
-    LLMProviderType,
-    Model,
-    ModelProvider,
-    get_provider_for_model,
-)
-from app.lib.llm.dependencies import LLMProviderDep, get_llm_provider
-from app.lib.llm.embeddings import EmbeddingModel, EmbeddingService
-from app.lib.llm.schemas.api import CreateModelRequest, InvokeModelRequest
-from app.lib.llm.utils import create_loader, create_rate_limit_retry
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
+if TYPE_CHECKING:
+    from app.lib.llm.base import LLMProvider
+    from app.lib.llm.config import (
+        InvocationMode,
+        LLMProviderType,
+        Model,
+        ModelProvider,
+        get_provider_for_model,
+    )
+    from app.lib.llm.dependencies import (
+        LLMProviderDep,
+        get_llm_provider,
+        set_llm_provider,
+    )
+    from app.lib.llm.embeddings import EmbeddingModel, EmbeddingService
+    from app.lib.llm.schemas.api import CreateModelRequest, InvokeModelRequest
+    from app.lib.llm.utils import (
+        Loader,
+        coalesce_stream,
+        create_http_client,
+        create_loader,
+        create_rate_limit_retry,
+        stream_with_timeout,
+        to_ndjson,
+        to_sse,
+    )
+
+# Export name -> defining module
+_EXPORTS: dict[str, str] = {
     # ABC
-    "LLMProvider",
+    "LLMProvider": "app.lib.llm.base",
     # Config
-    "LLMProviderType",
-    "Model",
-    "ModelProvider",
-    "InvocationMode",
-    "get_provider_for_model",
+    "LLMProviderType": "app.lib.llm.config",
+    "Model": "app.lib.llm.config",
+    "ModelProvider": "app.lib.llm.config",
+    "InvocationMode": "app.lib.llm.config",
+    "get_provider_for_model": "app.lib.llm.config",
     # Dependencies
-    "get_llm_provider",
-    "LLMProviderDep",
+    "get_llm_provider": "app.lib.llm.dependencies",
+    "set_llm_provider": "app.lib.llm.dependencies",
+    "LLMProviderDep": "app.lib.llm.dependencies",
     # Schemas
-    "CreateModelRequest",
-    "InvokeModelRequest",
+    "CreateModelRequest": "app.lib.llm.schemas.api",
+    "InvokeModelRequest": "app.lib.llm.schemas.api",
     # Resources
-    "create_loader",
+    "Loader": "app.lib.llm.utils",
+    "create_loader": "app.lib.llm.utils",
     # Retry
-    "create_rate_limit_retry",
+    "create_rate_limit_retry": "app.lib.llm.utils",
+    # HTTP
+    "create_http_client": "app.lib.llm.utils",
+    # Streaming
+    "coalesce_stream": "app.lib.llm.utils",
+    "stream_with_timeout": "app.lib.llm.utils",
+    "to_ndjson": "app.lib.llm.utils",
+    "to_sse": "app.lib.llm.utils",
     # Embeddings
-    "EmbeddingService",
+    "EmbeddingService": "app.lib.llm.embeddings",
+    "EmbeddingModel": "app.lib.llm.embeddings",
+}
+
+__all__ = [
+    "CreateModelRequest",
     "EmbeddingModel",
+    "EmbeddingService",
+    "InvocationMode",
+    "InvokeModelRequest",
+    "LLMProvider",
+    "LLMProviderDep",
+    "LLMProviderType",
+    "Loader",
+    "Model",
+    "ModelProvider",
+    "coalesce_stream",
+    "create_http_client",
+    "create_loader",
+    "create_rate_limit_retry",
+    "get_llm_provider",
+    "get_provider_for_model",
+    "set_llm_provider",
+    "stream_with_timeout",
+    "to_ndjson",
+    "to_sse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access and cache them on the package."""
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module globals plus lazily exported names."""
+    return sorted([*globals(), *__all__])
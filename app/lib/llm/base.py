@@ -18,6 +18,8 @@ class LLMProvider(ABC):
     Provides shared utilities and defines required interface for:
     - Model creation with configurable parameters
     - Three invocation modes: invoke, batch, stream
+    - Direct streaming via stream_model (no awaited wrapper)
+    - Completion-order batch results via invoke_model_iter
     """
 
     def format_prompt(
@@ -29,20 +31,22 @@ class LLMProvider(ABC):
         system_prompt: Annotated[str | None, "System instructions"] = None,
     ) -> str:
         """Format prompt with XML structure for conversation context."""
-        parts = []
+        # Build all sections in one list and join once (history can be long)
+        parts: list[str] = []
 
         if system_prompt:
-            parts.append(f"<system>\n{system_prompt}\n</system>")
+            parts += ("<system>\n", system_prompt, "\n</system>\n\n")
 
         if history:
-            history_text = "\n".join(
-                f"<{msg['role']}>{msg['content']}</{msg['role']}>" for msg in history
-            )
-            parts.append(f"<history>\n{history_text}\n</history>")
+            parts.append("<history>\n")
+            for msg in history:
+                role = msg["role"]
+                parts += ("<", role, ">", msg["content"], "</", role, ">\n")
+            parts.append("</history>\n\n")
 
-        parts.append(f"<current_message>\n{current_message}\n</current_message>")
+        parts += ("<current_message>\n", current_message, "\n</current_message>")
 
-        return "\n\n".join(parts)
+        return "".join(parts)
 
     @abstractmethod
     def create_model(
@@ -74,7 +78,50 @@ class LLMProvider(ABC):
         ] = None,
         model_provider: Annotated[str | None, "Provider identifier"] = None,
         temperature: Annotated[float, "Sampling temperature (0.0 to 1.0)"] = 0.0,
+        max_concurrency: Annotated[
+            int | None, "Max parallel calls in batch mode (default: provider limit)"
+        ] = None,
+        response_cache: Annotated[
+            bool, "Reuse exact-match invoke responses when temperature is 0"
+        ] = True,
         **kwargs,
     ) -> str | list[str] | AsyncIterator[str]:
-        """Invoke LLM with specified mode."""
+        """Invoke LLM with specified mode.
+
+        Deterministic invoke calls may be answered from a response cache;
+        pass response_cache=False when every call must reach the model.
+        """
+        ...
+
+    @abstractmethod
+    def stream_model(
+        self,
+        prompt: Annotated[str, "Single prompt"],
+        model: Annotated[BaseChatModel | None, "Pre-configured model instance"] = None,
+        model_name: Annotated[
+            str | None, "Model identifier (required if model not provided)"
+        ] = None,
+        model_provider: Annotated[str | None, "Provider identifier"] = None,
+        temperature: Annotated[float, "Sampling temperature (0.0 to 1.0)"] = 0.0,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Stream LLM response chunks for a single prompt."""
+        ...
+
+    @abstractmethod
+    def invoke_model_iter(
+        self,
+        prompts: Annotated[list[str], "Prompts to invoke concurrently"],
+        model: Annotated[BaseChatModel | None, "Pre-configured model instance"] = None,
+        model_name: Annotated[
+            str | None, "Model identifier (required if model not provided)"
+        ] = None,
+        model_provider: Annotated[str | None, "Provider identifier"] = None,
+        temperature: Annotated[float, "Sampling temperature (0.0 to 1.0)"] = 0.0,
+        max_concurrency: Annotated[
+            int | None, "Max parallel calls (default: provider limit)"
+        ] = None,
+        **kwargs,
+    ) -> AsyncIterator[tuple[int, str]]:
+        """Yield (index, content) pairs for a batch as each prompt completes."""
         ...
@@ -10,6 +10,7 @@ Model specifications sourced from:
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
 from typing import Literal
 
 # OpenRouter routing preference type
@@ -57,9 +58,15 @@ class Model(str, Enum):
 
     def with_openrouter_routing(self, routing: OpenRouterRouting = None) -> str:
         """Get model ID with optional OpenRouter routing suffix."""
-        if routing:
-            return f"{self.value}:{routing}"
-        return self.value
+        return _ROUTED_MODEL_IDS[self, routing]
+
+
+# Model IDs for every (model, routing) pair, built once instead of per call
+_ROUTED_MODEL_IDS: dict[tuple[Model, OpenRouterRouting], str] = {
+    (m, r): f"{m.value}:{r}" if r else m.value
+    for m in Model
+    for r in (None, "floor", "nitro")
+}
 
 
 class InvocationMode(str, Enum):
@@ -75,7 +82,7 @@ class InvocationMode(str, Enum):
 # -----------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Configuration for a specific LLM model."""
 
@@ -119,30 +126,63 @@ PROVIDER_MAX_CONCURRENCY: dict[ModelProvider, int] = {
     ModelProvider.GOOGLE: 5,
 }
 
+# Provider-specific token budgets (tokens per minute, unset = unlimited)
+PROVIDER_TOKENS_PER_MINUTE: dict[ModelProvider, int] = {
+    ModelProvider.GROQ: 250_000,
+}
+
+# Fail at import, not per request, if a Model or provider lacks configuration
+if missing := set(Model) - MODEL_CONFIG.keys():
+    raise ValueError(f"Missing MODEL_CONFIG entries: {sorted(missing)}")
+if missing := set(ModelProvider) - PROVIDER_MAX_CONCURRENCY.keys():
+    raise ValueError(f"Missing PROVIDER_MAX_CONCURRENCY entries: {sorted(missing)}")
+
 
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
 
 
+@cache
 def get_model_config(model: Model) -> ModelConfig:
     """Get configuration for a specific model."""
-    if model not in MODEL_CONFIG:
-        raise ValueError(f"Unknown model: {model}")
-    return MODEL_CONFIG[model]
+    try:
+        return MODEL_CONFIG[model]
+    except KeyError:
+        raise ValueError(f"Unknown model: {model}") from None
 
 
+@cache
 def get_provider_for_model(model: Model) -> ModelProvider:
     """Get the appropriate provider for a given model."""
     return get_model_config(model).provider
 
 
+@cache
 def get_max_output_tokens(model: Model) -> int:
     """Get max output tokens for a model."""
     return get_model_config(model).max_output_tokens
 
 
+@cache
 def get_max_concurrency(model: Model) -> int:
     """Get max concurrency based on the model's provider."""
     provider = get_model_config(model).provider
     return PROVIDER_MAX_CONCURRENCY[provider]
+
+
+__all__ = [
+    "MODEL_CONFIG",
+    "PROVIDER_MAX_CONCURRENCY",
+    "PROVIDER_TOKENS_PER_MINUTE",
+    "InvocationMode",
+    "LLMProviderType",
+    "Model",
+    "ModelConfig",
+    "ModelProvider",
+    "OpenRouterRouting",
+    "get_max_concurrency",
+    "get_max_output_tokens",
+    "get_model_config",
+    "get_provider_for_model",
+]
@@ -1,19 +1,28 @@
 """LLM provider dependency injection."""
 
-from typing import TYPE_CHECKING, Annotated
+from typing import Annotated
 
 from fastapi import Depends
 
-if TYPE_CHECKING:
-    from app.lib.llm.base import LLMProvider
+from app.lib.llm.base import LLMProvider
+from app.lib.llm.factory import get_llm_provider as _factory_get_llm_provider
 
+_provider: LLMProvider | None = None
 
-def get_llm_provider() -> "LLMProvider":
-    """Get configured LLM provider instance based on LLM_PROVIDER setting."""
-    from app.lib.llm.factory import get_llm_provider as factory_get_provider
 
-    return factory_get_provider()
+def get_llm_provider() -> LLMProvider:
+    """Get configured LLM provider instance based on LLM_PROVIDER setting (singleton)."""
+    global _provider
+    if _provider is None:
+        _provider = _factory_get_llm_provider()
+    return _provider
+
+
+def set_llm_provider(provider: LLMProvider | None) -> None:
+    """Replace the process-wide provider (None re-resolves from settings)."""
+    global _provider
+    _provider = provider
 
 
 # Type alias for dependency injection
-LLMProviderDep = Annotated["LLMProvider", Depends(get_llm_provider)]
+LLMProviderDep = Annotated[LLMProvider, Depends(get_llm_provider)]
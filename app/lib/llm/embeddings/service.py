@@ -1,14 +1,55 @@
 """Embeddings service."""
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Annotated
 
+import numpy as np
 from langchain_openai import OpenAIEmbeddings
 
+from app.lib.llm.config import ModelProvider
 from app.lib.llm.embeddings.config import EmbeddingModel, embeddings_settings
+from app.lib.llm.rate_limit import estimate_tokens, get_limiter
+from app.lib.llm.utils import create_http_client
+from app.lib.utils import MicroBatcher
 
 logger = logging.getLogger(__name__)
 
+# Inputs per request when embed_documents fans out across concurrent calls
+EMBED_CHUNK_SIZE = 256
+
+# Enum member -> raw model name (plain strings pass through unchanged)
+_MODEL_NAMES: dict[EmbeddingModel | str, str] = {m: m.value for m in EmbeddingModel}
+
+
+@lru_cache(maxsize=8)
+def _build_embeddings(model: str, dimensions: int, api_key: str) -> OpenAIEmbeddings:
+    """Build embeddings client shared by all services with the same config."""
+    return OpenAIEmbeddings(
+        model=model,
+        api_key=api_key,
+        dimensions=dimensions,
+        http_async_client=create_http_client(timeout=120.0),
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_query_batcher(
+    model: str, dimensions: int, api_key: str
+) -> MicroBatcher[None, str, list[float]]:
+    """Get query batcher shared by all services with the same config.
+
+    Coalesces concurrent embed_query calls into one aembed_documents request.
+    """
+    embeddings = _build_embeddings(model, dimensions, api_key)
+
+    async def embed_batch(_: None, texts: list[str]) -> list[list[float]]:
+        async with get_limiter(ModelProvider.OPENAI).acquire(estimate_tokens(texts)):
+            return await embeddings.aembed_documents(texts)
+
+    return MicroBatcher(embed_batch, max_batch=128)
+
 
 class EmbeddingService:
     """OpenAI embeddings service."""
@@ -20,31 +61,63 @@ class EmbeddingService:
         dimensions: Annotated[int | None, "Vector dimensions"] = None,
     ):
         """Initialize embeddings with OpenAI."""
-        model_name = model.value if isinstance(model, EmbeddingModel) else model
-        self._model = model_name or embeddings_settings.EMBEDDING_MODEL
+        self._model = (
+            _MODEL_NAMES.get(model, model) or embeddings_settings.EMBEDDING_MODEL
+        )
         self._dimensions = dimensions or embeddings_settings.EMBEDDING_DIMENSIONS
 
-        self._embeddings = OpenAIEmbeddings(
-            model=self._model,
-            api_key=api_key or embeddings_settings.openai_api_key,
-            dimensions=self._dimensions,
-        )
+        api_key = api_key or embeddings_settings.openai_api_key
+        self._embeddings = _build_embeddings(self._model, self._dimensions, api_key)
+        self._query_batcher = _get_query_batcher(self._model, self._dimensions, api_key)
 
     async def embed_query(
         self,
         text: Annotated[str, "Text to embed"],
     ) -> list[float]:
-        """Generate embedding for a single query text."""
-        return await self._embeddings.aembed_query(text)
+        """Generate embedding for a single query text.
+
+        Concurrent calls are coalesced into a single batch request.
+        """
+        return await self._query_batcher.submit(None, text)
 
     async def embed_documents(
         self,
         texts: Annotated[list[str], "Texts to embed"],
     ) -> list[list[float]]:
-        """Generate embeddings for multiple documents."""
+        """Generate embeddings for multiple documents.
+
+        Inputs are split into chunks embedded concurrently, bounded by the
+        provider limiter's concurrency; output order matches input order.
+        """
         if not texts:
             return []
-        return await self._embeddings.aembed_documents(texts)
+        limiter = get_limiter(ModelProvider.OPENAI)
+
+        async def embed_chunk(chunk: list[str]) -> list[list[float]]:
+            async with limiter.acquire(estimate_tokens(chunk)):
+                return await self._embeddings.aembed_documents(chunk)
+
+        if len(texts) <= EMBED_CHUNK_SIZE:
+            return await embed_chunk(texts)
+
+        chunks = [
+            texts[i : i + EMBED_CHUNK_SIZE]
+            for i in range(0, len(texts), EMBED_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(*(embed_chunk(c) for c in chunks))
+        return [vector for result in results for vector in result]
+
+    async def embed_documents_np(
+        self,
+        texts: Annotated[list[str], "Texts to embed"],
+        dtype: Annotated[
+            type[np.floating], "Vector dtype (np.float16 halves memory)"
+        ] = np.float32,
+    ) -> np.ndarray:
+        """Generate embeddings as one contiguous (len(texts), dimensions) array."""
+        if not texts:
+            return np.empty((0, self._dimensions), dtype=dtype)
+        return np.asarray(await self.embed_documents(texts), dtype=dtype)
 
     @property
     def model(self) -> str:
@@ -4,12 +4,15 @@ Implements the Strategy pattern by selecting the appropriate LLM provider
 based on application configuration.
 """
 
+import logging
 from collections.abc import Callable
 from functools import lru_cache
 
 from app.core.autodiscover import ModuleType, require_module
 from app.lib.llm.base import LLMProvider
-from app.lib.llm.config import LLMProviderType
+from app.lib.llm.config import LLMProviderType, Model, get_provider_for_model
+
+logger = logging.getLogger(__name__)
 
 
 @lru_cache(maxsize=1)
@@ -32,6 +35,26 @@ def get_llm_provider() -> LLMProvider:
     return provider_factory()
 
 
+def warm_up_models() -> list[str]:
+    """Pre-build models from LLM_WARMUP_MODELS so first requests reuse cached instances."""
+    from app.lib.llm.settings import llm_settings
+
+    provider = get_llm_provider()
+    warmed = []
+    for name in llm_settings.warmup_models:
+        try:
+            model = Model(name)
+            provider.create_model(model, get_provider_for_model(model))
+            warmed.append(name)
+        except Exception as e:
+            logger.warning(f"LLM warm-up failed for {name}: {e}")
+
+    if warmed:
+        logger.info(f"✓ LLM models warmed: {', '.join(warmed)}")
+
+    return warmed
+
+
 @require_module(ModuleType.INTEGRATIONS, "langchain")
 def _get_langchain_provider() -> LLMProvider:
     """Lazy import LangChain provider."""
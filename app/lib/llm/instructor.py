@@ -3,6 +3,7 @@
 Provides cached async client for LLM structured data extraction.
 """
 
+import logging
 from functools import lru_cache
 from typing import Annotated
 
@@ -15,31 +16,69 @@ from openai import AsyncOpenAI
 from app.core.config import settings
 from app.lib.llm.config import ModelProvider
 from app.lib.llm.settings import llm_settings
+from app.lib.llm.utils import create_http_client
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4)
+def _get_redis_pool(
+    url: str, max_connections: int, socket_timeout: float
+) -> redis.ConnectionPool:
+    """Get connection pool shared by every RedisCache for the same URL."""
+    return redis.ConnectionPool.from_url(
+        url,
+        max_connections=max_connections,
+        socket_timeout=socket_timeout,
+        socket_connect_timeout=socket_timeout,
+        socket_keepalive=True,
+    )
 
 
 class RedisCache(BaseCache):
-    """Redis-backed cache for Instructor responses."""
+    """Redis-backed cache for Instructor responses.
+
+    Instructor calls get/set synchronously from its async path, so lookups
+    run on the event loop: the pool is bounded, socket timeouts are tight,
+    and Redis errors degrade to a cache miss instead of stalling requests.
+    """
 
-    def __init__(self, url: str, ttl: int = 3600):
-        self.client = redis.from_url(url)
+    def __init__(
+        self,
+        url: str,
+        ttl: int = 3600,
+        max_connections: int = 128,
+        socket_timeout: float = 0.25,
+    ):
+        self.client = redis.Redis(
+            connection_pool=_get_redis_pool(url, max_connections, socket_timeout)
+        )
         self.ttl = ttl
 
     def get(self, key: str) -> str | None:
         """Get cached value by key."""
-        value: bytes | None = self.client.get(key)
+        try:
+            value: bytes | None = self.client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Instructor cache get failed: {e}")
+            return None
         return value.decode("utf-8") if value else None
 
     def set(self, key: str, value: str, **_: int) -> None:
         """Set cache value with TTL."""
-        self.client.setex(key, self.ttl, value)
+        try:
+            self.client.setex(key, self.ttl, value)
+        except redis.RedisError as e:
+            logger.warning(f"Instructor cache set failed: {e}")
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=8)
 def _get_redis_cache(ttl: int = 3600) -> RedisCache:
     """Get Redis cache instance for Instructor."""
     return RedisCache(url=settings.REDIS_URL, ttl=ttl)
 
 
+@lru_cache(maxsize=16)
 def get_extraction_client(
     provider: Annotated[ModelProvider, "Model provider"] = ModelProvider.OPENROUTER,
     mode: Annotated[instructor.Mode, "Extraction mode"] = instructor.Mode.JSON,
@@ -50,12 +89,16 @@ def get_extraction_client(
 
     Supports OpenRouter and Groq providers.
     Optionally enables Redis caching for responses.
+    Clients are memoized per configuration.
     """
     cache = _get_redis_cache(cache_ttl) if cache_enabled else None
 
-    if provider == ModelProvider.GROQ:
+    if ModelProvider(provider) is ModelProvider.GROQ:
         return instructor.from_groq(
-            AsyncGroq(api_key=llm_settings.GROQ_API_KEY),
+            AsyncGroq(
+                api_key=llm_settings.GROQ_API_KEY,
+                http_client=create_http_client(timeout=300.0),
+            ),
             mode=instructor.Mode.JSON,  # Groq works best with JSON mode
             cache=cache,
         )
@@ -65,6 +108,7 @@ def get_extraction_client(
         AsyncOpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=llm_settings.OPENROUTER_API_KEY,
+            http_client=create_http_client(timeout=300.0),
         ),
         mode=mode,
         cache=cache,
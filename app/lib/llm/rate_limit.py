@@ -0,0 +1,115 @@
+"""Per-provider rate limiting for LLM and embedding calls.
+
+Each provider gets a concurrency gate sized from PROVIDER_MAX_CONCURRENCY and,
+when PROVIDER_TOKENS_PER_MINUTE sets a budget, a token bucket refilled
+continuously. A 429 response pauses the provider for its Retry-After delay.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated
+from weakref import WeakKeyDictionary
+
+from app.lib.llm.config import (
+    PROVIDER_MAX_CONCURRENCY,
+    PROVIDER_TOKENS_PER_MINUTE,
+    ModelProvider,
+)
+
+logger = logging.getLogger(__name__)
+
+# Pause applied on 429 when the response carries no Retry-After header
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def estimate_tokens(texts: Annotated[list[str], "Texts sent to the provider"]) -> int:
+    """Rough token estimate (~4 characters per token)."""
+    return sum(len(t) for t in texts) // 4
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    """Extract Retry-After seconds from a 429 error, None for other errors."""
+    if getattr(exc, "status_code", None) != 429:
+        return None
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after", DEFAULT_RETRY_AFTER))
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+class ProviderLimiter:
+    """Concurrency gate plus optional tokens-per-minute bucket for one provider."""
+
+    def __init__(self, max_concurrency: int, tokens_per_minute: int | None = None):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.tokens_per_minute = tokens_per_minute
+        self._tokens = float(tokens_per_minute or 0)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+
+    @asynccontextmanager
+    async def acquire(
+        self, tokens: Annotated[int, "Estimated tokens for the call"] = 0
+    ) -> AsyncIterator[None]:
+        """Hold a concurrency slot and reserve tokens for one provider call."""
+        async with self._semaphore:
+            await self._take_tokens(tokens)
+            try:
+                yield
+            except Exception as e:
+                if (delay := _retry_after(e)) is not None:
+                    logger.warning(f"Provider rate limited, pausing {delay:.1f}s")
+                    self._paused_until = max(
+                        self._paused_until, time.monotonic() + delay
+                    )
+                raise
+
+    async def _take_tokens(self, tokens: int) -> None:
+        """Wait out any 429 pause and until the bucket can cover the request."""
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+
+            capacity = self.tokens_per_minute
+            if not capacity:
+                return
+
+            elapsed = now - self._refilled_at
+            self._tokens = min(capacity, self._tokens + elapsed * capacity / 60)
+            self._refilled_at = now
+
+            # Oversized requests go through once the bucket is full
+            if self._tokens >= min(tokens, capacity):
+                self._tokens -= tokens
+                return
+            await asyncio.sleep((min(tokens, capacity) - self._tokens) * 60 / capacity)
+
+
+# Asyncio primitives are loop-bound (Celery runs each task on a fresh loop)
+_limiters: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, ProviderLimiter]] = (
+    WeakKeyDictionary()
+)
+
+
+def get_limiter(
+    provider: Annotated[ModelProvider | str, "Provider to rate limit"],
+) -> ProviderLimiter:
+    """Get the shared limiter for a provider on the running event loop."""
+    provider = ModelProvider(provider)
+    limiters = _limiters.setdefault(asyncio.get_running_loop(), {})
+    limiter = limiters.get(provider)
+    if limiter is None:
+        limiter = limiters[provider] = ProviderLimiter(
+            PROVIDER_MAX_CONCURRENCY[provider],
+            PROVIDER_TOKENS_PER_MINUTE.get(provider),
+        )
+    return limiter
+
+
+__all__ = ["ProviderLimiter", "estimate_tokens", "get_limiter"]
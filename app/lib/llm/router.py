@@ -6,6 +6,12 @@ from fastapi.responses import StreamingResponse
 from app.lib.llm.config import InvocationMode
 from app.lib.llm.dependencies import LLMProviderDep
 from app.lib.llm.schemas.api import CreateModelRequest, InvokeModelRequest
+from app.lib.llm.utils import (
+    coalesce_stream,
+    stream_with_timeout,
+    to_ndjson,
+    to_sse,
+)
 
 router = APIRouter()
 
@@ -14,35 +20,48 @@ router = APIRouter()
 async def test_create_model(req: CreateModelRequest, provider: LLMProviderDep):
     """Test creating a chat model via the configured provider."""
     llm = provider.create_model(
-        model=req.model.value,
-        model_provider=req.model_provider.value if req.model_provider else None,
+        model=req.model,
+        model_provider=req.model_provider,
         temperature=req.temperature,
     )
     return {
         "provider": type(provider).__name__,
         "model_created": True,
         "model_type": type(llm).__name__,
-        "model_name": req.model.value,
+        "model_name": req.model,
     }
 
 
 @router.post("/invoke", summary="Test Invoke Model")
 async def test_invoke_model(req: InvokeModelRequest, provider: LLMProviderDep):
     """Test invoking a model with different modes via the configured provider."""
+    # req.mode holds the raw value (use_enum_values): plain str compare, no Enum.__eq__
+    if req.mode == InvocationMode.STREAM.value:
+        stream = provider.stream_model(
+            req.prompt,
+            model_name=req.model,
+            model_provider=req.model_provider,
+            temperature=req.temperature,
+        )
+        stream = coalesce_stream(stream_with_timeout(stream, req.stream_timeout))
+        if req.sse:
+            return StreamingResponse(to_sse(stream), media_type="text/event-stream")
+        return StreamingResponse(stream, media_type="text/plain")
+
+    if req.mode == InvocationMode.BATCH.value and req.stream_batch:
+        results = provider.invoke_model_iter(
+            req.prompt,
+            model_name=req.model,
+            model_provider=req.model_provider,
+            temperature=req.temperature,
+        )
+        return StreamingResponse(to_ndjson(results), media_type="application/x-ndjson")
+
     result = await provider.invoke_model(
         req.prompt,
-        mode=req.mode.value,
-        model_name=req.model.value,
-        model_provider=req.model_provider.value if req.model_provider else None,
+        mode=req.mode,
+        model_name=req.model,
+        model_provider=req.model_provider,
         temperature=req.temperature,
     )
-
-    if req.mode == InvocationMode.STREAM:
-
-        async def generate():
-            async for chunk in result:
-                yield chunk
-
-        return StreamingResponse(generate(), media_type="text/plain")
-
     return {"response": result}
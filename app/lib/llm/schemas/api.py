@@ -1,6 +1,6 @@
 """LLM API request schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.lib.llm.config import InvocationMode, Model, ModelProvider
 
@@ -8,6 +8,8 @@ from app.lib.llm.config import InvocationMode, Model, ModelProvider
 class CreateModelRequest(BaseModel):
     """Request for testing model creation."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True, use_enum_values=True)
+
     model: Model = Field(default=Model.GPT_OSS_20B, description="Model to create")
     model_provider: ModelProvider | None = Field(
         default=ModelProvider.GROQ, description="Model provider"
@@ -20,6 +22,8 @@ class CreateModelRequest(BaseModel):
 class InvokeModelRequest(BaseModel):
     """Request for testing model invocation."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True, use_enum_values=True)
+
     prompt: str | list[str] = Field(description="Prompt text or list for batch mode")
     mode: InvocationMode = Field(
         default=InvocationMode.INVOKE, description="Invocation mode"
@@ -31,3 +35,13 @@ class InvokeModelRequest(BaseModel):
     temperature: float = Field(
         default=0.0, ge=0.0, le=1.0, description="Sampling temperature"
     )
+    sse: bool = Field(
+        default=False, description="Frame STREAM output as Server-Sent Events"
+    )
+    stream_batch: bool = Field(
+        default=False,
+        description="Stream BATCH results as NDJSON lines in completion order",
+    )
+    stream_timeout: float = Field(
+        default=60.0, gt=0, description="Max seconds to stream before closing"
+    )
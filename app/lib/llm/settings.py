@@ -28,6 +28,10 @@ class LLMSettings(BaseSettings):
         default=LLMProviderType.LANGCHAIN.value,
         description="LLM provider (langchain, openai)",
     )
+    LLM_WARMUP_MODELS: str = Field(
+        default="",
+        description="Comma-separated models to pre-build at startup (e.g., gpt-5-nano)",
+    )
 
     model_config = SettingsConfigDict(
         case_sensitive=True,
@@ -35,6 +39,11 @@ class LLMSettings(BaseSettings):
         extra="allow",
     )
 
+    @property
+    def warmup_models(self) -> list[str]:
+        """Parse LLM_WARMUP_MODELS into a list of model identifiers."""
+        return [m.strip() for m in self.LLM_WARMUP_MODELS.split(",") if m.strip()]
+
 
 generate_module_env(ModuleType.LIB, __file__, LLMSettings)
 llm_settings = LLMSettings()
@@ -1,10 +1,18 @@
-"""LLM utilities for prompts, schemas, and retry handling."""
+"""LLM utilities for prompts, schemas, streaming, and retry handling."""
 
-import json
-from collections.abc import Callable
+import asyncio
+import logging
+import mmap
+import os
+import re
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 
+import httpx
+import orjson
 from tenacity import (
     retry,
     retry_if_exception,
@@ -12,6 +20,28 @@ from tenacity import (
     wait_random_exponential,
 )
 
+logger = logging.getLogger(__name__)
+
+# Connection ceiling for provider HTTP clients (provider limiters bound actual concurrency)
+HTTP_MAX_CONNECTIONS = 2000
+
+
+def create_http_client(
+    timeout: Annotated[float, "Request timeout in seconds"],
+) -> httpx.AsyncClient:
+    """Create HTTP client for a cached LLM or embeddings client.
+
+    Keep-alive stays disabled: cached clients are shared across event loops
+    (Celery runs each task on a fresh loop), so no pooled connection may
+    outlive the loop that opened it.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=0
+        ),
+        timeout=httpx.Timeout(timeout),
+    )
+
 
 def _is_rate_limit_error(exc: BaseException) -> bool:
     """Check if exception is a 429 rate limit error."""
@@ -32,6 +62,146 @@ def create_rate_limit_retry(
     )
 
 
+async def coalesce_stream(
+    chunks: Annotated[AsyncIterator[str], "Token-level stream chunks"],
+    max_chars: Annotated[int, "Flush once buffered text reaches this size"] = 256,
+    max_delay: Annotated[
+        float, "Flush once buffer is older than this (seconds)"
+    ] = 0.015,
+) -> AsyncIterator[str]:
+    """Merge small stream chunks into fewer writes; the first chunk is never delayed.
+
+    Buffered text is flushed once it is max_delay old even if the source goes quiet,
+    and the source iterator is closed when the stream ends or is abandoned.
+    """
+    loop = asyncio.get_running_loop()
+    buffer: list[str] = []
+    size = 0
+    deadline = 0.0
+    first = True
+    pending: asyncio.Future[str] | None = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(chunks))
+            if buffer:
+                # Wait for the next chunk only until the buffer is due
+                done, _ = await asyncio.wait(
+                    {pending}, timeout=max(deadline - loop.time(), 0)
+                )
+                if not done:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    size = 0
+                    continue
+            try:
+                chunk = await pending
+            except StopAsyncIteration:
+                break
+            finally:
+                if pending.done():
+                    pending = None
+
+            if first:
+                yield chunk  # Preserve time-to-first-token
+                first = False
+                continue
+
+            if not buffer:
+                deadline = loop.time() + max_delay
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= max_chars or loop.time() >= deadline:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.wait({pending})  # Source must be idle before aclose()
+        await chunks.aclose()
+
+
+async def stream_with_timeout(
+    chunks: Annotated[AsyncIterator[str], "Text stream chunks"],
+    timeout: Annotated[float, "Max seconds before the stream is cut off"],
+) -> AsyncIterator[str]:
+    """End the stream cleanly after `timeout` seconds, closing the source iterator."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    try:
+        while True:
+            # Scope only the await, never the yield, so cancellation stays local
+            async with asyncio.timeout_at(deadline):
+                chunk = await anext(chunks)
+            yield chunk
+    except StopAsyncIteration:
+        pass
+    except TimeoutError:
+        logger.warning(f"Stream cut off after {timeout}s")
+    finally:
+        await chunks.aclose()
+
+
+async def to_sse(
+    chunks: Annotated[AsyncIterator[str], "Text stream chunks"],
+) -> AsyncIterator[bytes]:
+    """Frame text chunks as Server-Sent Events (`data: {"t": ...}`) encoded with orjson."""
+    async for chunk in chunks:
+        yield b"data: " + orjson.dumps({"t": chunk}) + b"\n\n"
+
+
+async def to_ndjson(
+    results: Annotated[AsyncIterator[tuple[int, str]], "(index, content) pairs"],
+) -> AsyncIterator[bytes]:
+    """Frame indexed batch results as NDJSON lines (`{"idx": ..., "content": ...}`)."""
+    async for idx, content in results:
+        yield orjson.dumps({"idx": idx, "content": content}) + b"\n"
+
+
+# Resource files above this size are memory-mapped instead of buffered reads
+_MMAP_THRESHOLD = 16 * 1024
+
+# Linux: skip the atime update (a metadata write) on every cold read
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read file bytes via a raw fd, memory-mapping large files."""
+    try:
+        fd = os.open(path, os.O_RDONLY | _O_NOATIME)
+    except PermissionError:  # O_NOATIME requires owning the file
+        fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:]
+        with open(fd, "rb", buffering=0, closefd=False) as f:
+            return f.read()
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=256)
+def _read_text(path: Path, mtime_ns: int) -> str:
+    """Read file text, memoized until its mtime changes."""
+    return _read_bytes(path).decode("utf-8")
+
+
+@lru_cache(maxsize=256)
+def _compile_template(
+    path: Path, mtime_ns: int, placeholders: tuple[str, ...]
+) -> tuple[str, ...]:
+    """Split prompt into literal chunks with placeholders at odd indices."""
+    ordered = sorted(placeholders, key=len, reverse=True)  # Longest match first
+    pattern = re.compile(f"({'|'.join(map(re.escape, ordered))})")
+    return tuple(pattern.split(_read_text(path, mtime_ns)))
+
+
 def load_prompt(
     name: Annotated[str, "Prompt filename without extension"],
     prompts_dir: Annotated[Path, "Directory containing prompt files"],
@@ -39,27 +209,132 @@ def load_prompt(
 ) -> str:
     """Load prompt from markdown file and apply placeholder replacements."""
     path = prompts_dir / f"{name}.md"
-    content = path.read_text()
+    mtime_ns = path.stat().st_mtime_ns
+    if not replacements:
+        return _read_text(path, mtime_ns)
+
+    # Template is split once per placeholder set; rendering is a single join
+    parts = list(_compile_template(path, mtime_ns, tuple(sorted(replacements))))
+    parts[1::2] = [replacements[p] for p in parts[1::2]]
+    return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _read_json(path: Path, mtime_ns: int) -> dict:
+    """Parse JSON file, memoized until its mtime changes."""
+    return orjson.loads(_read_bytes(path))
+
+
+def load_schema(
+    name: Annotated[str, "Schema filename without extension"],
+    schemas_dir: Annotated[Path, "Directory containing schema files"],
+) -> dict:
+    """Load JSON schema (cached and shared between callers; treat as read-only)."""
+    path = schemas_dir / f"{name}.json"
+    return _read_json(path, path.stat().st_mtime_ns)
+
+
+# Schemas load in two phases: the index carries only name/title/description for
+# listing, and load_schema promotes one name to its full schema when it is used
+
+
+@lru_cache(maxsize=32)
+def _summarize_schemas(files: tuple[tuple[Path, int], ...]) -> dict[str, dict]:
+    """Build {name: {title, description}} for a snapshot of schema files."""
+    index = {}
+    for path, mtime_ns in files:
+        schema = _read_json(path, mtime_ns)
+        index[path.stem] = {
+            "title": schema.get("title", path.stem),
+            "description": schema.get("description", ""),
+        }
+    return index
+
 
-    for placeholder, value in replacements.items():
-        content = content.replace(placeholder, value)
+def _scan_files(directory: Path, suffix: str) -> tuple[tuple[Path, int], ...]:
+    """List (path, mtime_ns) for files with suffix in one os.scandir pass."""
+    try:
+        with os.scandir(directory) as entries:
+            return tuple(
+                sorted(
+                    (Path(entry.path), entry.stat().st_mtime_ns)
+                    for entry in entries
+                    if entry.name.endswith(suffix) and entry.is_file()
+                )
+            )
+    except FileNotFoundError:
+        return ()
 
-    return content
+
+def load_schema_index(
+    schemas_dir: Annotated[Path, "Directory containing schema files"],
+) -> dict[str, dict]:
+    """List schema summaries by name (cached until a schema file changes)."""
+    return _summarize_schemas(_scan_files(schemas_dir, ".json"))
+
+
+@dataclass(frozen=True, slots=True)
+class Loader:
+    """Prompt and schema loader bound to one LLM resource directory."""
+
+    prompts_dir: Path
+    schemas_dir: Path
+
+    @classmethod
+    def from_base_dir(cls, base_dir: Path) -> "Loader":
+        """Create loader for base_dir/prompts and base_dir/schemas."""
+        return cls(base_dir / "prompts", base_dir / "schemas")
+
+    def load_prompt(self, name: str, **replacements: str) -> str:
+        """Load prompt from the prompts directory."""
+        return load_prompt(name, self.prompts_dir, **replacements)
+
+    def load_schema(self, name: str) -> dict:
+        """Load JSON schema from the schemas directory."""
+        return load_schema(name, self.schemas_dir)
+
+    def load_schema_index(self) -> dict[str, dict]:
+        """List schema summaries from the schemas directory."""
+        return load_schema_index(self.schemas_dir)
+
+    def prewarm(self) -> None:
+        """Read every prompt and schema into the caches, one directory scan each."""
+        for path, mtime_ns in _scan_files(self.prompts_dir, ".md"):
+            _read_text(path, mtime_ns)
+        load_schema_index(self.schemas_dir)  # Parses every schema
+
+
+# Loaders handed out by create_loader, pre-warmed together at startup
+_loaders: list[Loader] = []
 
 
 def create_loader(
     base_dir: Path,
 ) -> tuple[Callable[..., str], Callable[[str], dict]]:
     """Factory to create resource loaders for any LLM resource directory."""
+    loader = Loader.from_base_dir(base_dir)
+    _loaders.append(loader)
+    return loader.load_prompt, loader.load_schema
 
-    def _load_prompt(name: str, **replacements: str) -> str:
-        return load_prompt(name, base_dir / "prompts", **replacements)
-
-    def _load_schema(name: str) -> dict:
-        path = base_dir / "schemas" / f"{name}.json"
-        return json.loads(path.read_text())
 
-    return _load_prompt, _load_schema
+def prewarm_loaders() -> None:
+    """Pre-read prompts and schemas for every loader made by create_loader."""
+    for loader in _loaders:
+        loader.prewarm()
 
 
-__all__ = ["create_loader", "create_rate_limit_retry", "load_prompt"]
+__all__ = [
+    "HTTP_MAX_CONNECTIONS",
+    "Loader",
+    "coalesce_stream",
+    "create_http_client",
+    "create_loader",
+    "create_rate_limit_retry",
+    "load_prompt",
+    "load_schema",
+    "load_schema_index",
+    "prewarm_loaders",
+    "stream_with_timeout",
+    "to_ndjson",
+    "to_sse",
+]
@@ -22,6 +22,9 @@ class TelephonyProvider(Protocol):
         to_number: Annotated[str, "Destination phone number (E.164 format)"],
         from_number: Annotated[str, "Caller ID phone number (E.164 format)"],
         webhook_url: Annotated[str, "URL to receive call events"],
+        idempotency_key: Annotated[
+            str | None, "Key that makes retries dial at most once"
+        ] = None,
     ) -> str:
         """Initiate an outbound call. Returns external call ID from provider."""
         ...
@@ -29,6 +32,9 @@ class TelephonyProvider(Protocol):
     async def answer_call(
         self,
         call_id: Annotated[str, "External call ID from the provider"],
+        idempotency_key: Annotated[
+            str | None, "Key that makes retries answer at most once"
+        ] = None,
     ) -> None:
         """Answer an incoming call."""
         ...
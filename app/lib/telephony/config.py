@@ -3,10 +3,10 @@
 Defines provider type enums used for configuration and factory selection.
 """
 
-from enum import Enum
+from enum import StrEnum
 
 
-class TelephonyProviderType(str, Enum):
+class TelephonyProviderType(StrEnum):
     """Available telephony providers."""
 
     TELNYX = "telnyx"
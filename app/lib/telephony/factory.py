@@ -5,6 +5,7 @@ based on application configuration.
 """
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Annotated
 
 from app.core.autodiscover import ModuleType, require_module
@@ -15,6 +16,7 @@ from app.lib.telephony.config import TelephonyProviderType
 _DEFAULT_PROVIDER = TelephonyProviderType.TELNYX
 
 
+@lru_cache(maxsize=4)
 def get_telephony_provider(
     provider_type: Annotated[
         TelephonyProviderType | None, "Provider type override, defaults to Telnyx"
@@ -23,15 +25,11 @@ def get_telephony_provider(
     """Get the configured telephony provider."""
     provider_type = provider_type or _DEFAULT_PROVIDER
 
-    providers: dict[str, Callable[[], TelephonyProvider]] = {
-        TelephonyProviderType.TELNYX.value: _get_telnyx_provider,
-    }
-
-    provider_factory = providers.get(provider_type.value)
+    provider_factory = _PROVIDER_FACTORIES.get(provider_type)
     if not provider_factory:
-        available = ", ".join(providers.keys())
         raise ValueError(
-            f"Unknown telephony provider: {provider_type}. Available: {available}"
+            f"Unknown telephony provider: {provider_type}. "
+            f"Available: {_AVAILABLE_PROVIDERS}"
         )
 
     return provider_factory()
@@ -43,3 +41,10 @@ def _get_telnyx_provider() -> TelephonyProvider:
     from app.integrations.telnyx.provider import get_telephony_provider
 
     return get_telephony_provider()
+
+
+# Provider type -> factory (defined after the factories it references)
+_PROVIDER_FACTORIES: dict[str, Callable[[], TelephonyProvider]] = {
+    TelephonyProviderType.TELNYX: _get_telnyx_provider,
+}
+_AVAILABLE_PROVIDERS = ", ".join(_PROVIDER_FACTORIES)
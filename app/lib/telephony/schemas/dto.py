@@ -3,19 +3,19 @@
 Common data structures used across telephony providers.
 """
 
-from enum import Enum
+from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class CallDirection(str, Enum):
+class CallDirection(StrEnum):
     """Direction of a phone call."""
 
     INBOUND = "inbound"
     OUTBOUND = "outbound"
 
 
-class CallStatus(str, Enum):
+class CallStatus(StrEnum):
     """Status of a phone call."""
 
     INITIATED = "initiated"
@@ -45,3 +45,5 @@ class CallResult(BaseModel):
     duration_seconds: int | None = Field(
         default=None, description="Call duration in seconds"
     )
+
+    model_config = ConfigDict(frozen=True)
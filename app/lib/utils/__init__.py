@@ -1,5 +1,6 @@
 """Utility functions and decorators."""
 
+from .batcher import MicroBatcher
 from .retry import async_retry, retry
 
-__all__ = ["async_retry", "retry"]
+__all__ = ["MicroBatcher", "async_retry", "retry"]
@@ -0,0 +1,84 @@
+"""Keyed micro-batcher that coalesces concurrent calls into one request.
+
+Shared by the embeddings query batcher and the vectorstore search batcher.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Annotated, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[K, T, R]):
+    """Coalesce concurrent submissions per key into one call of `run`.
+
+    `run(key, items)` must return one result per item, in order. A key's batch
+    is sent once it holds `max_batch` items or `max_delay` seconds after its
+    first item, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        run: Annotated[
+            Callable[[K, list[T]], Awaitable[Sequence[R]]],
+            "Send one batch for a key",
+        ],
+        max_batch: Annotated[int, "Items per batch"] = 32,
+        max_delay: Annotated[float, "Seconds to wait for more items"] = 0.005,
+    ):
+        self._run_batch = run
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[K, list[tuple[T, asyncio.Future[R]]]] = {}
+        self._timers: dict[K, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        key: Annotated[K, "Batch key (items with different keys never share a batch)"],
+        item: Annotated[T, "Item to add to the key's next batch"],
+    ) -> R:
+        """Queue item for the key's next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:  # Futures are loop-bound (Celery: loop per task)
+            self._loop, self._pending, self._timers = loop, {}, {}
+
+        future = loop.create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((item, future))
+        if len(pending) >= self.max_batch:
+            self._dispatch(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_delay, self._dispatch, key)
+        return await future
+
+    def _dispatch(self, key: K) -> None:
+        """Send the key's pending items as one batch."""
+        if (timer := self._timers.pop(key, None)) is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, [])
+        if batch:
+            task = self._loop.create_task(self._run(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: K, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        """Run one batch and resolve each caller's future."""
+        try:
+            results = await self._run_batch(key, [item for item, _ in batch])
+            for (_, future), result in zip(batch, results):
+                if not future.done():  # Caller may have been cancelled
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancelled mid-request (e.g. loop shutdown): don't leave callers waiting
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
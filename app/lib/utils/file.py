@@ -1,12 +1,26 @@
 """File utilities for reading and writing files."""
 
+import mmap
 from pathlib import Path
 from typing import Annotated
 
+# Files above this size are decoded straight from a memory map
+MMAP_THRESHOLD = 64 * 1024
+
 
 def read_file(path: Annotated[Path | str, "File path to read"]) -> str:
     """Read file content with error handling."""
     file_path = Path(path) if isinstance(path, str) else path
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
-    return file_path.read_text(encoding="utf-8")
+    if file_path.stat().st_size <= MMAP_THRESHOLD:
+        return file_path.read_text(encoding="utf-8")
+    with (
+        open(file_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        # Decode from the mapping without an intermediate bytes copy
+        text = str(mm, "utf-8")
+        if mm.find(b"\r") != -1:  # Match read_text's universal newlines
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
@@ -1,13 +1,74 @@
-"""Retry decorators with exponential backoff for sync and async functions."""
+"""Retry decorators with exponential backoff for sync and async functions.
+
+Built on tenacity, shared with the LLM rate-limit retry in app.lib.llm.utils.
+"""
 
-import asyncio
 import logging
-import time
-from functools import wraps
-from typing import Annotated, Callable, Type, TypeVar
+import random
+from typing import Annotated, Callable, Type
+
+from tenacity import RetryCallState, retry_if_exception, stop_after_attempt
+from tenacity import retry as tenacity_retry
 
 logger = logging.getLogger(__name__)
-T = TypeVar("T")
+
+
+def _jittered(delay: float) -> float:
+    """Spread delay over [0.5, 1.5)x so concurrent callers don't retry in lockstep."""
+    return delay * random.uniform(0.5, 1.5)
+
+
+def _is_retryable(exc: BaseException, retry_on_status: set[int] | None) -> bool:
+    """Check exception's HTTP status (if any) against the retryable set."""
+    if retry_on_status is None:
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status is None or status in retry_on_status
+
+
+def _build_retry(
+    max_retries: int,
+    exceptions: tuple[Type[Exception], ...],
+    backoff_base: float,
+    log_attempts: bool,
+    max_delay: float,
+    retry_on_status: set[int] | None,
+    retry_if: Callable[[BaseException], bool] | None,
+) -> Callable:
+    """Build tenacity decorator (handles both sync and coroutine functions)."""
+
+    def wait(state: RetryCallState) -> float:
+        return _jittered(min(max_delay, backoff_base**state.attempt_number))
+
+    def before_sleep(state: RetryCallState) -> None:
+        if log_attempts:
+            logger.warning(
+                f"{state.fn.__name__} attempt {state.attempt_number}/{max_retries} "
+                f"failed: {state.outcome.exception()}"
+            )
+
+    def on_exhausted(state: RetryCallState):
+        logger.error(
+            f"{state.fn.__name__} failed after {max_retries} attempts",
+            exc_info=state.outcome.exception(),
+        )
+        return state.outcome.result()  # Re-raise the last exception
+
+    return tenacity_retry(
+        retry=retry_if_exception(
+            lambda e: (
+                isinstance(e, exceptions)
+                and _is_retryable(e, retry_on_status)
+                and (retry_if is None or retry_if(e))
+            )
+        ),
+        wait=wait,
+        stop=stop_after_attempt(max_retries),
+        before_sleep=before_sleep,
+        retry_error_callback=on_exhausted,
+    )
 
 
 def retry(
@@ -19,32 +80,25 @@ def retry(
         float, "Exponential backoff base (delay = base^attempt)"
     ] = 2.0,
     log_attempts: Annotated[bool, "Log warning on each failed attempt"] = True,
+    max_delay: Annotated[float, "Upper bound for a single backoff delay"] = 30.0,
+    retry_on_status: Annotated[
+        set[int] | None, "HTTP statuses to retry (others raise immediately)"
+    ] = None,
+    retry_if: Annotated[
+        Callable[[BaseException], bool] | None,
+        "Extra predicate an exception must pass to be retried",
+    ] = None,
 ) -> Callable:
-    """Decorator for sync functions with exponential backoff retry."""
-
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            for attempt in range(1, max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    if attempt == max_retries:
-                        logger.error(
-                            f"{func.__name__} failed after {max_retries} attempts",
-                            exc_info=True,
-                        )
-                        raise
-                    if log_attempts:
-                        logger.warning(
-                            f"{func.__name__} attempt {attempt}/{max_retries} failed: {e}"
-                        )
-                    time.sleep(backoff_base**attempt)
-            raise RuntimeError(f"{func.__name__} exhausted all retries")
-
-        return wrapper
-
-    return decorator
+    """Decorator for sync functions with jittered, capped exponential backoff retry."""
+    return _build_retry(
+        max_retries,
+        exceptions,
+        backoff_base,
+        log_attempts,
+        max_delay,
+        retry_on_status,
+        retry_if,
+    )
 
 
 def async_retry(
@@ -56,29 +110,22 @@ def async_retry(
         float, "Exponential backoff base (delay = base^attempt)"
     ] = 2.0,
     log_attempts: Annotated[bool, "Log warning on each failed attempt"] = True,
+    max_delay: Annotated[float, "Upper bound for a single backoff delay"] = 30.0,
+    retry_on_status: Annotated[
+        set[int] | None, "HTTP statuses to retry (others raise immediately)"
+    ] = None,
+    retry_if: Annotated[
+        Callable[[BaseException], bool] | None,
+        "Extra predicate an exception must pass to be retried",
+    ] = None,
 ) -> Callable:
-    """Decorator for async functions with exponential backoff retry."""
-
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        async def wrapper(*args, **kwargs) -> T:
-            for attempt in range(1, max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except exceptions as e:
-                    if attempt == max_retries:
-                        logger.error(
-                            f"{func.__name__} failed after {max_retries} attempts",
-                            exc_info=True,
-                        )
-                        raise
-                    if log_attempts:
-                        logger.warning(
-                            f"{func.__name__} attempt {attempt}/{max_retries} failed: {e}"
-                        )
-                    await asyncio.sleep(backoff_base**attempt)
-            raise RuntimeError(f"{func.__name__} exhausted all retries")
-
-        return wrapper
-
-    return decorator
+    """Decorator for async functions with jittered, capped exponential backoff retry."""
+    return _build_retry(
+        max_retries,
+        exceptions,
+        backoff_base,
+        log_attempts,
+        max_delay,
+        retry_on_status,
+        retry_if,
+    )
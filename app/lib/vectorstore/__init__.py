@@ -2,9 +2,10 @@
 
 from app.lib.vectorstore.config import VectorStoreSettings, vectorstore_settings
 from app.lib.vectorstore.dependencies import VectorStoreDep, get_vectorstore
-from app.lib.vectorstore.service import VectorStore
+from app.lib.vectorstore.service import CircuitOpenError, VectorStore
 
 __all__ = [
+    "CircuitOpenError",
     "VectorStore",
     "VectorStoreSettings",
     "vectorstore_settings",
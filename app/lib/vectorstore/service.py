@@ -1,15 +1,249 @@
 """Qdrant vectorstore service."""
 
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Annotated, Any
 
+import grpc
+import numpy as np
+import orjson
+from pydantic import TypeAdapter
 from qdrant_client import AsyncQdrantClient, models
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 
-from app.lib.utils.retry import async_retry
+from app.lib.utils import MicroBatcher, async_retry
 from app.lib.vectorstore.config import vectorstore_settings
 
 logger = logging.getLogger(__name__)
 
+# Returned by upsert/delete on empty input (shared; don't mutate)
+_EMPTY_UPDATE_RESULT = models.UpdateResult(operation_id=0, status=models.UpdateStatus.COMPLETED)
+
+# Transport failures and these statuses/gRPC codes are retried; other 4xx (e.g. bad filter) never succeed
+_RETRYABLE_ERRORS = (ResponseHandlingException, UnexpectedResponse, grpc.aio.AioRpcError)
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+_RETRYABLE_GRPC_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+}
+
+# Consecutive transient failures that open a collection's circuit, and how long it stays open
+BREAKER_THRESHOLD = 5
+BREAKER_RESET_AFTER = 30.0
+
+# Search results cache; TTL bounds staleness from writers in other processes
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 30.0
+# Seconds after a wait=False write during which results aren't cached (the write may not be indexed yet)
+SEARCH_CACHE_WRITE_GRACE = 5.0
+
+
+class _SearchCache:
+    """In-process LRU cache of search results with a TTL, invalidated per collection.
+
+    Each write bumps its collection's generation; a search only caches its result if the
+    generation is unchanged since it started, so results read before a write never land.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = SEARCH_CACHE_SIZE,
+        ttl: float = SEARCH_CACHE_TTL,
+        write_grace: float = SEARCH_CACHE_WRITE_GRACE,
+    ):
+        self._data: OrderedDict[tuple, tuple[float, list[models.ScoredPoint]]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._unapplied_until: dict[str, float] = {}
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.write_grace = write_grace
+
+    def generation(self, collection: str) -> int:
+        """Current write generation of a collection (pass to set())."""
+        return self._generations.get(collection, 0)
+
+    def get(self, key: tuple) -> list[models.ScoredPoint] | None:
+        """Get unexpired cached points and mark them as recently used."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, points = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return list(points)
+
+    def set(self, key: tuple, points: list[models.ScoredPoint], generation: int) -> None:
+        """Cache points read at generation, evicting the least recently used entry when full.
+
+        Skipped if the collection was written since (or has a write that may still be unapplied).
+        """
+        collection = key[0]
+        if generation != self.generation(collection):
+            return
+        if (until := self._unapplied_until.get(collection)) is not None:
+            if until > time.monotonic():
+                return
+            del self._unapplied_until[collection]
+        self._data[key] = (time.monotonic() + self.ttl, list(points))
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, collection: str, applied: bool = True) -> None:
+        """Drop cached results for a collection (keys start with its name) and bump its generation.
+
+        applied=False marks a wait=False write: caching stays off for the grace period.
+        """
+        self._generations[collection] = self.generation(collection) + 1
+        if not applied:
+            self._unapplied_until[collection] = time.monotonic() + self.write_grace
+        for key in [k for k in self._data if k[0] == collection]:
+            del self._data[key]
+
+
+_FILTER_ADAPTER = TypeAdapter(models.Filter)
+
+
+def _filter_key(filter: dict[str, Any] | None) -> bytes | None:
+    """Canonical (sorted-key) JSON of a filter, None if empty or not JSON-encodable."""
+    if not filter:
+        return None
+    try:
+        return orjson.dumps(filter, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None  # Filter holds Qdrant model objects
+
+
+@lru_cache(maxsize=256)
+def _parse_filter(filter_key: bytes) -> models.Filter:
+    """Validate each distinct filter once (instances are shared, don't mutate)."""
+    return _FILTER_ADAPTER.validate_json(filter_key)
+
+
+def _to_filter(filter: dict[str, Any] | None, filter_key: bytes | None) -> models.Filter | None:
+    """Build Qdrant filter, reusing the compiled instance when the filter is encodable."""
+    if not filter:
+        return None
+    if filter_key is None:
+        return models.Filter(**filter)
+    return _parse_filter(filter_key)
+
+
+def _as_vector(query_vector: list[float] | np.ndarray) -> np.ndarray:
+    """Contiguous float32 query vector (no copy when it already is one)."""
+    return np.ascontiguousarray(query_vector, dtype=np.float32)
+
+
+def _search_key(
+    collection: str,
+    query_vector: np.ndarray,
+    limit: int,
+    filter: dict[str, Any] | None,
+    filter_key: bytes | None,
+    score_threshold: float | None,
+    with_vectors: bool,
+) -> tuple | None:
+    """Build cache key from a digest of the float32 vector bytes, None if the filter isn't encodable."""
+    if filter and filter_key is None:
+        return None
+    digest = hashlib.blake2b(query_vector.data, digest_size=16).digest()
+    return (collection, digest, limit, filter_key, score_threshold, with_vectors)
+
+
+def _search_batcher(client: AsyncQdrantClient) -> MicroBatcher[str, models.QueryRequest, list[models.ScoredPoint]]:
+    """Coalesce concurrent searches per collection into one query_batch_points request."""
+
+    async def query_batch(collection: str, requests: list[models.QueryRequest]) -> list[list[models.ScoredPoint]]:
+        responses = await client.query_batch_points(collection_name=collection, requests=requests)
+        return [response.points for response in responses]
+
+    return MicroBatcher(query_batch)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a collection's circuit is open after repeated Qdrant failures."""
+
+    def __init__(
+        self,
+        collection: Annotated[str, "Collection name"],
+        retry_in: Annotated[float, "Seconds until the circuit closes"],
+    ):
+        self.collection = collection
+        self.retry_in = retry_in
+        super().__init__(f"Qdrant circuit open for collection '{collection}', retry in {retry_in:.1f}s")
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Check if a Qdrant error is worth retrying (transport failure, 429/5xx or transient gRPC code)."""
+    if isinstance(exc, UnexpectedResponse):
+        return exc.status_code in _RETRYABLE_STATUSES
+    if isinstance(exc, grpc.aio.AioRpcError):
+        return exc.code() in _RETRYABLE_GRPC_CODES
+    return isinstance(exc, ResponseHandlingException)
+
+
+class _CircuitBreaker:
+    """Per-collection breaker: opens after consecutive transient failures, fails fast while open."""
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, reset_after: float = BREAKER_RESET_AFTER):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self._failures: dict[str, int] = {}
+        self._open_until: dict[str, float] = {}
+
+    @contextmanager
+    def guard(self, collection: str) -> Iterator[None]:
+        """Fail fast while the circuit is open, otherwise record the call's outcome."""
+        if (retry_in := self._open_until.get(collection, 0.0) - time.monotonic()) > 0:
+            raise CircuitOpenError(collection, retry_in)
+        try:
+            yield
+        except Exception as e:
+            if _is_transient(e):
+                failures = self._failures[collection] = self._failures.get(collection, 0) + 1
+                if failures >= self.threshold:
+                    logger.warning(f"Opening circuit for collection '{collection}' after {failures} failures")
+                    self._open_until[collection] = time.monotonic() + self.reset_after
+                    self._failures[collection] = 0
+            raise
+        self._failures.pop(collection, None)
+
+
+@dataclass(slots=True)
+class _PooledClient:
+    """Qdrant client shared by VectorStores with the same connection config."""
+
+    client: AsyncQdrantClient
+    search_cache: _SearchCache
+    batcher: MicroBatcher[str, models.QueryRequest, list[models.ScoredPoint]]
+    breaker: _CircuitBreaker = field(default_factory=_CircuitBreaker)
+    refs: int = 0
+
+
+# Connection config -> shared client; closed when the last VectorStore releases it
+_client_pool: dict[tuple[str, str, int, bool], _PooledClient] = {}
+
+
+def _acquire_client(key: tuple[str, str, int, bool]) -> _PooledClient:
+    """Get (or open) the pooled client for a connection config and take a reference."""
+    pooled = _client_pool.get(key)
+    if pooled is None:
+        url, api_key, timeout, prefer_grpc = key
+        client = AsyncQdrantClient(url=url, api_key=api_key, timeout=timeout, prefer_grpc=prefer_grpc)
+        pooled = _client_pool[key] = _PooledClient(client, _SearchCache(), _search_batcher(client))
+    pooled.refs += 1
+    return pooled
+
 
 class VectorStore:
     """Async Qdrant vectorstore client."""
@@ -21,18 +255,31 @@ class VectorStore:
         timeout: Annotated[int | None, "Request timeout"] = None,
         prefer_grpc: Annotated[bool | None, "Use gRPC"] = None,
     ):
-        """Initialize Qdrant client."""
-        self._client = AsyncQdrantClient(
-            url=url or vectorstore_settings.QDRANT_URL,
-            api_key=api_key or vectorstore_settings.QDRANT_API_KEY,
-            timeout=timeout or vectorstore_settings.QDRANT_TIMEOUT,
-            prefer_grpc=prefer_grpc if prefer_grpc is not None else vectorstore_settings.QDRANT_PREFER_GRPC,
+        """Initialize Qdrant client (shared with stores using the same connection config)."""
+        self._pool_key = (
+            url or vectorstore_settings.QDRANT_URL,
+            api_key or vectorstore_settings.QDRANT_API_KEY,
+            timeout or vectorstore_settings.QDRANT_TIMEOUT,
+            prefer_grpc if prefer_grpc is not None else vectorstore_settings.QDRANT_PREFER_GRPC,
         )
+        pooled = _acquire_client(self._pool_key)
+        self._client = pooled.client
+        self._search_cache = pooled.search_cache
+        self._batcher = pooled.batcher
+        self._breaker = pooled.breaker
+        self._closed = False
         self._default_dimension = vectorstore_settings.QDRANT_DEFAULT_DIMENSION
 
     async def close(self) -> None:
-        """Close client connection."""
-        await self._client.close()
+        """Release client connection (closed once no other store shares it)."""
+        if self._closed:
+            return
+        self._closed = True
+        pooled = _client_pool[self._pool_key]
+        pooled.refs -= 1
+        if pooled.refs == 0:
+            del _client_pool[self._pool_key]
+            await self._client.close()
 
     # -------------------------------------------------------------------------
     # Collection Management
@@ -64,6 +311,7 @@ class VectorStore:
         if not await self._client.collection_exists(name):
             return False
         await self._client.delete_collection(name)
+        self._search_cache.invalidate(name)
         logger.info(f"Deleted collection '{name}'")
         return True
 
@@ -79,81 +327,143 @@ class VectorStore:
         self,
         collection: Annotated[str, "Collection name"],
         points: Annotated[list[models.PointStruct], "Points to upsert"],
+        wait: Annotated[bool, "Wait until the update is applied"] = True,
     ) -> models.UpdateResult:
         """Upsert points into collection."""
         if not points:
-            return models.UpdateResult(operation_id=0, status=models.UpdateStatus.COMPLETED)
+            return _EMPTY_UPDATE_RESULT
 
-        return await self._client.upsert(
+        result = await self._client.upsert(
             collection_name=collection,
             points=points,
-            wait=True,
+            wait=wait,
         )
+        self._search_cache.invalidate(collection, applied=wait)
+        return result
+
+    async def upsert_many(
+        self,
+        collection: Annotated[str, "Collection name"],
+        point_batches: Annotated[list[list[models.PointStruct]], "Point batches to upsert"],
+        wait: Annotated[bool, "Wait until each update is applied"] = False,
+    ) -> list[models.UpdateResult]:
+        """Upsert point batches concurrently (bulk ingest; by default doesn't wait for indexing)."""
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.upsert(collection, batch, wait=wait)) for batch in point_batches]
+        return [task.result() for task in tasks]
 
     async def delete(
         self,
         collection: Annotated[str, "Collection name"],
         ids: Annotated[list[str | int], "Point IDs to delete"],
+        wait: Annotated[bool, "Wait until the update is applied"] = True,
     ) -> models.UpdateResult:
         """Delete points by IDs."""
         if not ids:
-            return models.UpdateResult(operation_id=0, status=models.UpdateStatus.COMPLETED)
+            return _EMPTY_UPDATE_RESULT
 
-        return await self._client.delete(
+        result = await self._client.delete(
             collection_name=collection,
             points_selector=models.PointIdsList(points=ids),
-            wait=True,
+            wait=wait,
         )
+        self._search_cache.invalidate(collection, applied=wait)
+        return result
 
     # -------------------------------------------------------------------------
     # Search Operations
     # -------------------------------------------------------------------------
 
-    @async_retry(max_retries=3)
+    @async_retry(max_retries=3, exceptions=_RETRYABLE_ERRORS, retry_if=_is_transient)
     async def search(
         self,
         collection: Annotated[str, "Collection name"],
-        query_vector: Annotated[list[float], "Query embedding"],
+        query_vector: Annotated[list[float] | np.ndarray, "Query embedding"],
         limit: Annotated[int, "Max results"] = 10,
         filter: Annotated[dict[str, Any] | None, "Metadata filter"] = None,
         score_threshold: Annotated[float | None, "Min score"] = None,
         with_vectors: Annotated[bool, "Include vectors in results"] = False,
     ) -> list[models.ScoredPoint]:
-        """Similarity search."""
-        qdrant_filter = models.Filter(**filter) if filter else None
+        """Similarity search (repeated queries are served from an in-process cache)."""
+        query_vector = _as_vector(query_vector)
+        filter_key = _filter_key(filter)
+        key = _search_key(collection, query_vector, limit, filter, filter_key, score_threshold, with_vectors)
+        if key is not None and (cached := self._search_cache.get(key)) is not None:
+            return cached
+        generation = self._search_cache.generation(collection)
 
-        results = await self._client.query_points(
-            collection_name=collection,
-            query=query_vector,
+        qdrant_filter = _to_filter(filter, filter_key)
+
+        with self._breaker.guard(collection):
+            results = await self._client.query_points(
+                collection_name=collection,
+                query=query_vector,
+                limit=limit,
+                query_filter=qdrant_filter,
+                score_threshold=score_threshold,
+                with_payload=True,
+                with_vectors=with_vectors,
+            )
+
+        if key is not None:
+            self._search_cache.set(key, results.points, generation)
+        return results.points
+
+    @async_retry(max_retries=3, exceptions=_RETRYABLE_ERRORS, retry_if=_is_transient)
+    async def search_batched(
+        self,
+        collection: Annotated[str, "Collection name"],
+        query_vector: Annotated[list[float] | np.ndarray, "Query embedding"],
+        limit: Annotated[int, "Max results"] = 10,
+        filter: Annotated[dict[str, Any] | None, "Metadata filter"] = None,
+        score_threshold: Annotated[float | None, "Min score"] = None,
+        with_vectors: Annotated[bool, "Include vectors in results"] = False,
+    ) -> list[models.ScoredPoint]:
+        """Similarity search sent with concurrent calls as one batch request (adds up to 5ms)."""
+        query_vector = _as_vector(query_vector)
+        filter_key = _filter_key(filter)
+        key = _search_key(collection, query_vector, limit, filter, filter_key, score_threshold, with_vectors)
+        if key is not None and (cached := self._search_cache.get(key)) is not None:
+            return cached
+        generation = self._search_cache.generation(collection)
+
+        request = models.QueryRequest(
+            query=query_vector.tolist(),
             limit=limit,
-            query_filter=qdrant_filter,
+            filter=_to_filter(filter, filter_key),
             score_threshold=score_threshold,
             with_payload=True,
-            with_vectors=with_vectors,
+            with_vector=with_vectors,
         )
+        with self._breaker.guard(collection):
+            points = await self._batcher.submit(collection, request)
 
-        return results.points
+        if key is not None:
+            self._search_cache.set(key, points, generation)
+        return points
 
-    @async_retry(max_retries=3)
+    @async_retry(max_retries=3, exceptions=_RETRYABLE_ERRORS, retry_if=_is_transient)
     async def search_with_params(
         self,
         collection: Annotated[str, "Collection name"],
-        query_vector: Annotated[list[float], "Query embedding"],
+        query_vector: Annotated[list[float] | np.ndarray, "Query embedding"],
         limit: Annotated[int, "Number of results"] = 4,
         filter: Annotated[dict[str, Any] | None, "Metadata filter"] = None,
         exact: Annotated[bool, "Use exact search (slower but more accurate)"] = False,
     ) -> list[models.ScoredPoint]:
         """Search with custom search parameters."""
-        qdrant_filter = models.Filter(**filter) if filter else None
+        query_vector = _as_vector(query_vector)
+        qdrant_filter = _to_filter(filter, _filter_key(filter))
 
-        results = await self._client.query_points(
-            collection_name=collection,
-            query=query_vector,
-            limit=limit,
-            query_filter=qdrant_filter,
-            with_payload=True,
-            with_vectors=False,
-            search_params=models.SearchParams(exact=exact),
-        )
+        with self._breaker.guard(collection):
+            results = await self._client.query_points(
+                collection_name=collection,
+                query=query_vector,
+                limit=limit,
+                query_filter=qdrant_filter,
+                with_payload=True,
+                with_vectors=False,
+                search_params=models.SearchParams(exact=exact),
+            )
 
         return results.points
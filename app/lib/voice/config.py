@@ -3,10 +3,10 @@
 Defines provider type enums used for configuration and factory selection.
 """
 
-from enum import Enum
+from enum import StrEnum
 
 
-class STTProviderType(str, Enum):
+class STTProviderType(StrEnum):
     """Available Speech-to-Text providers."""
 
     DEEPGRAM = "deepgram"
@@ -15,7 +15,7 @@ class STTProviderType(str, Enum):
     # ASSEMBLY_AI = "assemblyai"
 
 
-class TTSProviderType(str, Enum):
+class TTSProviderType(StrEnum):
     """Available Text-to-Speech providers."""
 
     DEEPGRAM = "deepgram"
@@ -18,7 +18,7 @@ def get_stt_provider() -> STTProvider:
     from app.core.config import settings
 
     providers: dict[str, Callable[[], STTProvider]] = {
-        STTProviderType.DEEPGRAM.value: _get_deepgram_stt,
+        STTProviderType.DEEPGRAM: _get_deepgram_stt,
     }
 
     provider_factory = providers.get(settings.STT_PROVIDER)
@@ -45,7 +45,7 @@ def get_tts_provider() -> TTSProvider:
     from app.core.config import settings
 
     providers: dict[str, Callable[[], TTSProvider]] = {
-        TTSProviderType.DEEPGRAM.value: _get_deepgram_tts,
+        TTSProviderType.DEEPGRAM: _get_deepgram_tts,
     }
 
     provider_factory = providers.get(settings.TTS_PROVIDER)
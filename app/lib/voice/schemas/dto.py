@@ -3,7 +3,7 @@
 Common data structures used across voice providers.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TranscriptionResult(BaseModel):
@@ -11,8 +11,12 @@ class TranscriptionResult(BaseModel):
 
     text: str = Field(..., description="Transcribed text from audio")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class SynthesisResult(BaseModel):
     """Result from text-to-speech synthesis."""
 
     audio_data: bytes = Field(..., description="Synthesized audio bytes (linear16 PCM)")
+
+    model_config = ConfigDict(frozen=True)
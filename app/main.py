@@ -7,6 +7,8 @@ See docs/tech-stack.md for FastAPI configuration details.
 See docs/architecture.md for application structure.
 """
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
@@ -14,32 +16,24 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.staticfiles import StaticFiles
-from scalar_fastapi import get_scalar_api_reference
 
 # Load .env file into os.environ before any imports that need env vars
 load_dotenv()
 
 from app.api import pages  # noqa: E402
 from app.api.router import api_router  # noqa: E402
-from app.core.admin import setup_admin  # noqa: E402
 from app.core.config import settings  # noqa: E402
 from app.core.database import init_db  # noqa: E402
 from app.core.openapi_tags import (  # noqa: E402
     get_openapi_tags_from_routes,
     get_tag_groups_from_routes,
 )
+from app.core.static import PrecomputedStaticFiles  # noqa: E402
 from app.core.templates import BASE_DIR  # noqa: E402
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Lifespan context manager for startup/shutdown events."""
-    import logging
-
-    _ = app  # Unused but required by FastAPI signature
-    logger = logging.getLogger(__name__)
-
-    # Startup: Initialize database tables (optional - server works without DB)
+async def _init_database(logger: logging.Logger) -> None:
+    """Initialize database tables (optional - server works without DB)."""
     try:
         await init_db()
     except Exception as e:
@@ -48,6 +42,48 @@ async def lifespan(app: FastAPI):
             "Server will start without database - DB-dependent features unavailable"
         )
 
+
+async def _warm_up_llm(logger: logging.Logger) -> None:
+    """Resolve LLM provider, pre-build models and read prompts off the event loop."""
+    try:
+        from app.lib.llm.dependencies import get_llm_provider
+        from app.lib.llm.factory import warm_up_models
+        from app.lib.llm.utils import prewarm_loaders
+
+        await asyncio.to_thread(get_llm_provider)
+        await asyncio.to_thread(warm_up_models)
+        await asyncio.to_thread(prewarm_loaders)
+    except Exception as e:
+        logger.warning(f"LLM warm-up failed: {e}")
+
+
+async def _warm_up_openapi(app: FastAPI, logger: logging.Logger) -> None:
+    """Build OpenAPI schema off the event loop so the first docs hit is warm."""
+    try:
+        await asyncio.to_thread(app.openapi)
+    except Exception as e:
+        logger.warning(f"OpenAPI schema warm-up failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Lifespan context manager for startup/shutdown events."""
+    logger = logging.getLogger(__name__)
+
+    # Startup: Setup admin interface once per app (imported here to keep sqladmin
+    # and every admin view out of module import)
+    if getattr(app.state, "admin", None) is None:
+        from app.core.admin import setup_admin
+
+        app.state.admin = setup_admin(app)
+
+    # Startup: Independent I/O and warm-up steps run concurrently
+    await asyncio.gather(
+        _init_database(logger),
+        _warm_up_llm(logger),
+        _warm_up_openapi(app, logger),
+    )
+
     yield
     # Shutdown: cleanup if needed
 
@@ -68,8 +104,14 @@ app.add_middleware(
     expose_headers=["X-Total-Count"],
 )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+# Mount static files (served from memory in production, from disk otherwise)
+# BASE_DIR is already resolved, so the directory string is a realpath computed once
+STATIC_DIR = str(BASE_DIR / "static")
+if settings.APP_ENVIRONMENT == "production":
+    static_app = PrecomputedStaticFiles(STATIC_DIR)
+else:
+    static_app = StaticFiles(directory=STATIC_DIR)
+app.mount("/static", static_app, name="static")
 
 # Setup page routes (templates)
 app.include_router(pages.router)
@@ -77,9 +119,6 @@ app.include_router(pages.router)
 # Setup API routes
 app.include_router(api_router, prefix="/api")
 
-# Setup admin interface
-setup_admin(app)
-
 
 def custom_openapi():
     """Customize OpenAPI schema with auto-discovered tags and x-tagGroups."""
@@ -111,6 +150,8 @@ app.openapi = custom_openapi
 
 @app.get("/scalar", include_in_schema=False)
 async def scalar_html():
+    from scalar_fastapi import get_scalar_api_reference
+
     return get_scalar_api_reference(
         openapi_url=app.openapi_url,
         title=app.title,
@@ -120,9 +161,13 @@ async def scalar_html():
 if __name__ == "__main__":
     import uvicorn
 
+    # Hot reload in development; worker processes in production (uvicorn[standard]
+    # picks uvloop and httptools automatically)
+    is_production = settings.APP_ENVIRONMENT == "production"
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=settings.PORT,
-        reload=True,
+        reload=not is_production,
+        workers=settings.WORKERS if is_production else 1,
     )
@@ -1,34 +1,53 @@
 """Base model utilities for common patterns."""
 
-from datetime import UTC, datetime
-from uuid import UUID, uuid4
+from datetime import datetime
+from uuid import UUID
 
-from sqlalchemy import Column, DateTime, ForeignKey
+from sqlalchemy import Column, DateTime, ForeignKey, func, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlmodel import Field, SQLModel
 
+# Column types and server defaults are stateless, so every model column shares them
+_PGUUID = PGUUID(as_uuid=True)
+_TIMESTAMPTZ = DateTime(timezone=True)
+_GEN_RANDOM_UUID = text("gen_random_uuid()")
+_NOW = func.now()
+
 
 def uuid_pk() -> Field:
-    """Create a UUID primary key field.
+    """Create a UUID primary key field generated by Postgres.
+
+    The value is assigned on INSERT (gen_random_uuid(), built in since
+    Postgres 13) and is available after flush/refresh.
 
     Returns:
         Field configured with UUID primary key
     """
     return Field(
-        default_factory=uuid4,
-        sa_column=Column(PGUUID(as_uuid=True), primary_key=True),
+        default=None,
+        primary_key=True,
+        sa_type=_PGUUID,
+        sa_column_kwargs={"server_default": _GEN_RANDOM_UUID},
     )
 
 
-def timestamp_field() -> Field:
-    """Create a timezone-aware timestamp field.
+def timestamp_field(*, on_update: bool = False) -> Field:
+    """Create a timezone-aware timestamp field set by the database clock.
+
+    Args:
+        on_update: Also set to now() on every UPDATE (for updated_at)
 
     Returns:
-        Field configured with UTC timestamp
+        Field configured with database-side now() default
     """
     return Field(
-        default_factory=lambda: datetime.now(UTC),
-        sa_column=Column(DateTime(timezone=True), nullable=False),
+        default=None,
+        nullable=False,
+        sa_type=_TIMESTAMPTZ,
+        sa_column_kwargs={
+            "server_default": _NOW,
+            "onupdate": _NOW if on_update else None,
+        },
     )
 
 
@@ -45,7 +64,7 @@ def uuid_fk(table: str, *, nullable: bool = False, index: bool = True) -> Field:
     """
     return Field(
         sa_column=Column(
-            PGUUID(as_uuid=True),
+            _PGUUID,
             ForeignKey(f"{table}.id"),
             nullable=nullable,
             index=index,
@@ -56,16 +75,6 @@ def uuid_fk(table: str, *, nullable: bool = False, index: bool = True) -> Field:
 class BaseTable(SQLModel):
     """Base model with UUID primary key and timestamps."""
 
-    id: UUID = Field(
-        default_factory=uuid4,
-        primary_key=True,
-        sa_type=PGUUID(as_uuid=True),
-    )
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
-        sa_type=DateTime(timezone=True),
-    )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
-        sa_type=DateTime(timezone=True),
-    )
+    id: UUID = uuid_pk()
+    created_at: datetime = timestamp_field()
+    updated_at: datetime = timestamp_field(on_update=True)
@@ -5,9 +5,9 @@ from .example_service import ExampleService, ExampleServiceDep, get_example_serv
 
 __all__ = [
     "BaseCRUDService",
-    "PaginatedResponse",
-    "PaginationType",
     "ExampleService",
     "ExampleServiceDep",
+    "PaginatedResponse",
+    "PaginationType",
     "get_example_service",
 ]
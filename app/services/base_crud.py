@@ -57,6 +57,9 @@ class BaseCRUDService(Generic[ModelType]):
         self.model = model
         self.session = session
         self._has_soft_delete = hasattr(model, "deleted_at")
+        # BaseTable's updated_at is set to now() by the UPDATE itself
+        updated_at = model.__table__.c.get("updated_at")
+        self._stamps_updated_at = updated_at is not None and updated_at.onupdate is None
 
     def _filter_soft_deleted(self, query: Select) -> Select:
         """Apply soft delete filter if model supports it."""
@@ -84,8 +87,8 @@ class BaseCRUDService(Generic[ModelType]):
         return True
 
     def _update_timestamp(self, instance: ModelType) -> None:
-        """Update instance's updated_at timestamp if field exists."""
-        if hasattr(instance, "updated_at"):
+        """Update instance's updated_at timestamp unless the database sets it."""
+        if self._stamps_updated_at:
             instance.updated_at = datetime.now(UTC)
 
     async def get_by_id(self, id: Any) -> ModelType:
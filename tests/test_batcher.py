@@ -0,0 +1,94 @@
+"""Micro-batcher tests."""
+
+import asyncio
+
+import pytest
+
+from app.lib.utils import MicroBatcher
+
+
+class Recorder:
+    """Batch function that records each batch and echoes (key, item) pairs."""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.batches: list[tuple[str, list[int]]] = []
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self, key: str, items: list[int]) -> list[tuple[str, int]]:
+        self.batches.append((key, items))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return [(key, item) for item in items]
+
+
+class TestMicroBatcher:
+    """Concurrent submissions share batch requests."""
+
+    async def test_fans_out_results(self):
+        """Concurrent items go out as one batch and each caller gets its own result."""
+        run = Recorder()
+        batcher = MicroBatcher(run)
+
+        results = await asyncio.gather(*(batcher.submit("a", n) for n in range(3)))
+
+        assert results == [("a", 0), ("a", 1), ("a", 2)]
+        assert run.batches == [("a", [0, 1, 2])]
+
+    async def test_splits_at_max_batch(self):
+        """A full batch is dispatched immediately and the rest follows."""
+        run = Recorder()
+        batcher = MicroBatcher(run, max_batch=2)
+
+        await asyncio.gather(*(batcher.submit("a", n) for n in range(5)))
+
+        assert [items for _, items in run.batches] == [[0, 1], [2, 3], [4]]
+
+    async def test_batches_per_key(self):
+        """Items with different keys are never mixed in one batch."""
+        run = Recorder()
+        batcher = MicroBatcher(run)
+
+        results = await asyncio.gather(
+            batcher.submit("a", 1), batcher.submit("b", 2), batcher.submit("a", 3)
+        )
+
+        assert results == [("a", 1), ("b", 2), ("a", 3)]
+        assert sorted(run.batches) == [("a", [1, 3]), ("b", [2])]
+
+    async def test_propagates_errors(self):
+        """A failed batch raises in every caller of that batch."""
+        batcher = MicroBatcher(Recorder(error=ValueError("boom")))
+
+        results = await asyncio.gather(
+            batcher.submit("a", 1), batcher.submit("a", 2), return_exceptions=True
+        )
+
+        assert [type(r) for r in results] == [ValueError, ValueError]
+
+    async def test_cancelled_batch_releases_callers(self):
+        """Callers don't hang when the batch request is cancelled."""
+        run = Recorder()
+        run.gate = asyncio.Event()
+        batcher = MicroBatcher(run)
+        callers = [asyncio.create_task(batcher.submit("a", n)) for n in (1, 2)]
+        while not run.batches:
+            await asyncio.sleep(0.001)
+
+        for task in list(batcher._tasks):
+            task.cancel()
+
+        for caller in callers:
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(caller, timeout=1)
+
+    def test_resets_for_new_event_loop(self):
+        """The batcher keeps working when each call runs on a fresh loop (Celery)."""
+        run = Recorder()
+        batcher = MicroBatcher(run)
+
+        assert asyncio.run(batcher.submit("a", 1)) == ("a", 1)
+        assert asyncio.run(batcher.submit("a", 2)) == ("a", 2)
+        assert run.batches == [("a", [1]), ("a", [2])]
@@ -0,0 +1,232 @@
+"""Tests for the LangChain LLM provider.
+
+Covers the per-provider concurrency limiter across invocation modes and the
+INVOKE response cache. Tests run against a fake chat model, so no API keys or
+network are needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.integrations.langchain import llm
+from app.lib.llm import rate_limit
+from app.lib.llm.config import InvocationMode, ModelProvider
+
+# Per-provider concurrency ceiling used by limited_provider
+PROVIDER_LIMIT = 2
+
+
+class FakeChatModel:
+    """Chat model stand-in that records how many upstream calls overlap."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    def _enter(self) -> None:
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+
+    async def ainvoke(self, prompt: str, config=None) -> SimpleNamespace:
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return SimpleNamespace(content=f"echo:{prompt}")
+
+    async def astream(self, prompt: str, config=None):
+        self._enter()
+        try:
+            for word in prompt.split():
+                await asyncio.sleep(self.delay)
+                yield SimpleNamespace(content=word)
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def fake_model() -> FakeChatModel:
+    """Provide a fresh fake chat model."""
+    return FakeChatModel()
+
+
+@pytest.fixture
+def limited_provider(monkeypatch) -> ModelProvider:
+    """Cap OpenAI at PROVIDER_LIMIT concurrent calls with no token budget."""
+    limits = {ModelProvider.OPENAI: PROVIDER_LIMIT}
+    monkeypatch.setattr(rate_limit, "PROVIDER_MAX_CONCURRENCY", limits)
+    monkeypatch.setattr(rate_limit, "PROVIDER_TOKENS_PER_MINUTE", {})
+    monkeypatch.setattr(llm, "PROVIDER_MAX_CONCURRENCY", limits)
+    return ModelProvider.OPENAI
+
+
+@pytest.fixture
+def provider() -> llm.LangChainLLMProvider:
+    """Provide a LangChain provider with an empty response cache."""
+    llm._response_cache.clear()
+    llm._inflight.clear()
+    return llm.LangChainLLMProvider()
+
+
+@pytest.fixture
+def named_model(monkeypatch, provider, fake_model) -> str:
+    """Model name that create_model resolves to the fake model."""
+    monkeypatch.setattr(provider, "create_model", lambda *args, **kwargs: fake_model)
+    return "test-model"
+
+
+class TestProviderLimiter:
+    """Every upstream request holds its own provider slot while it is open."""
+
+    async def test_invoke_respects_ceiling(
+        self, provider, fake_model, limited_provider
+    ):
+        """Concurrent INVOKE calls never exceed the provider limit."""
+        results = await asyncio.gather(
+            *(
+                provider.invoke_model(
+                    f"prompt {i}",
+                    model=fake_model,
+                    model_provider=limited_provider,
+                    response_cache=False,
+                )
+                for i in range(6)
+            )
+        )
+
+        assert results == [f"echo:prompt {i}" for i in range(6)]
+        assert fake_model.peak == PROVIDER_LIMIT
+
+    async def test_batch_takes_one_slot_per_prompt(
+        self, provider, fake_model, limited_provider
+    ):
+        """Two concurrent batches share the ceiling instead of one slot each."""
+        prompts = [f"p{i}" for i in range(4)]
+        batches = await asyncio.gather(
+            *(
+                provider.invoke_model(
+                    prompts,
+                    mode=InvocationMode.BATCH,
+                    model=fake_model,
+                    model_provider=limited_provider,
+                    max_concurrency=4,
+                )
+                for _ in range(2)
+            )
+        )
+
+        assert batches == [[f"echo:{p}" for p in prompts]] * 2
+        assert fake_model.calls == 8
+        assert fake_model.peak == PROVIDER_LIMIT
+
+    async def test_stream_holds_slot_until_exhausted(
+        self, provider, fake_model, limited_provider
+    ):
+        """Streams (both entry points) keep their slot while tokens are fetched."""
+
+        async def consume(stream) -> str:
+            return " ".join([chunk async for chunk in stream])
+
+        streams = [
+            provider.stream_model(
+                "a b c", model=fake_model, model_provider=limited_provider
+            )
+            for _ in range(2)
+        ] + [
+            await provider.invoke_model(
+                "a b c",
+                mode=InvocationMode.STREAM,
+                model=fake_model,
+                model_provider=limited_provider,
+            )
+            for _ in range(2)
+        ]
+        results = await asyncio.gather(*(consume(s) for s in streams))
+
+        assert results == ["a b c"] * 4
+        assert fake_model.peak == PROVIDER_LIMIT
+
+    async def test_closed_stream_releases_slot(
+        self, provider, fake_model, limited_provider
+    ):
+        """Abandoning a stream with aclose() frees its slot for other calls."""
+        for _ in range(PROVIDER_LIMIT):
+            stream = provider.stream_model(
+                "a b c", model=fake_model, model_provider=limited_provider
+            )
+            assert await anext(stream) == "a"
+            await stream.aclose()
+
+        result = await asyncio.wait_for(
+            provider.invoke_model(
+                "after", model=fake_model, model_provider=limited_provider
+            ),
+            timeout=1,
+        )
+        assert result == "echo:after"
+
+
+class TestResponseCache:
+    """Deterministic INVOKE calls built from a model name are cached."""
+
+    async def test_repeat_prompt_is_cached(self, provider, fake_model, named_model):
+        """The same prompt hits the model once."""
+        first = await provider.invoke_model("hi", model_name=named_model)
+        second = await provider.invoke_model("hi", model_name=named_model)
+
+        assert first == second == "echo:hi"
+        assert fake_model.calls == 1
+
+    async def test_other_prompt_misses(self, provider, fake_model, named_model):
+        """Only exact prompt matches are served from the cache."""
+        await provider.invoke_model("hi", model_name=named_model)
+        await provider.invoke_model("hello", model_name=named_model)
+
+        assert fake_model.calls == 2
+
+    async def test_expired_entry_misses(
+        self, provider, fake_model, named_model, monkeypatch
+    ):
+        """Entries older than the TTL are fetched again."""
+        monkeypatch.setattr(llm._response_cache, "ttl", 0.01)
+        await provider.invoke_model("hi", model_name=named_model)
+        await asyncio.sleep(0.02)
+        await provider.invoke_model("hi", model_name=named_model)
+
+        assert fake_model.calls == 2
+
+    async def test_opt_out(self, provider, fake_model, named_model):
+        """response_cache=False always calls the model."""
+        for _ in range(2):
+            await provider.invoke_model(
+                "hi", model_name=named_model, response_cache=False
+            )
+
+        assert fake_model.calls == 2
+
+    async def test_sampled_calls_are_not_cached(
+        self, provider, fake_model, named_model
+    ):
+        """Calls with a non-zero temperature always call the model."""
+        for _ in range(2):
+            await provider.invoke_model("hi", model_name=named_model, temperature=0.7)
+
+        assert fake_model.calls == 2
+
+    async def test_concurrent_calls_share_one_request(
+        self, provider, fake_model, named_model
+    ):
+        """Identical in-flight calls await a single upstream request."""
+        results = await asyncio.gather(
+            *(provider.invoke_model("hi", model_name=named_model) for _ in range(3))
+        )
+
+        assert results == ["echo:hi"] * 3
+        assert fake_model.calls == 1
+        assert not llm._inflight
@@ -0,0 +1,68 @@
+"""LLM streaming helper tests."""
+
+import asyncio
+
+from app.lib.llm.utils import coalesce_stream
+
+
+class Source:
+    """Async generator of chunks with optional pauses; records when it is closed."""
+
+    def __init__(self, *items: str | float):
+        self.items = items
+        self.closed = False
+
+    async def __call__(self):
+        try:
+            for item in self.items:
+                if isinstance(item, float):
+                    await asyncio.sleep(item)
+                else:
+                    yield item
+        finally:
+            self.closed = True
+
+
+class TestCoalesceStream:
+    """coalesce_stream merges chunks without holding text back or leaking the source."""
+
+    async def test_first_chunk_alone_then_merged(self):
+        """The first chunk passes straight through; quick followers are merged."""
+        source = Source("a", "b", "c")
+
+        chunks = [c async for c in coalesce_stream(source(), max_delay=1.0)]
+
+        assert chunks == ["a", "bc"]
+        assert source.closed
+
+    async def test_flushes_at_size(self):
+        """A buffer reaching max_chars is flushed immediately."""
+        source = Source("a", "bb", "cc", "d")
+
+        chunks = [c async for c in coalesce_stream(source(), max_chars=4)]
+
+        assert chunks == ["a", "bbcc", "d"]
+
+    async def test_flushes_on_deadline_when_source_is_quiet(self):
+        """Buffered text goes out after max_delay even if no new chunk arrives."""
+        source = Source("a", "b", 0.5, "c")
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        arrivals = []
+
+        async for chunk in coalesce_stream(source(), max_delay=0.01):
+            arrivals.append((chunk, loop.time() - start))
+
+        assert [chunk for chunk, _ in arrivals] == ["a", "b", "c"]
+        assert arrivals[1][1] < 0.25
+
+    async def test_closing_early_closes_source(self):
+        """Abandoning the stream mid-wait cancels the pending read and closes the source."""
+        source = Source("a", "b", 10.0, "c")
+        stream = coalesce_stream(source(), max_delay=0.01)
+
+        assert await anext(stream) == "a"
+        assert await anext(stream) == "b"
+        await asyncio.wait_for(stream.aclose(), timeout=1)
+
+        assert source.closed
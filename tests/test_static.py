@@ -0,0 +1,93 @@
+"""Precomputed static file serving tests.
+
+Production mounts PrecomputedStaticFiles instead of StaticFiles, so these
+tests mount it over a temporary directory the same way.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.static import PrecomputedStaticFiles
+
+CSS = b"body { color: red; }"
+
+
+@pytest.fixture
+def static_client(tmp_path) -> TestClient:
+    """Client for an app serving tmp_path at /static from memory."""
+    (tmp_path / "app.css").write_bytes(CSS)
+    (tmp_path / "js").mkdir()
+    (tmp_path / "js" / "app.js").write_bytes(b"console.log(1);")
+    (tmp_path / "data.bin").write_bytes(b"\x00\x01")
+    (tmp_path / "link.css").symlink_to(tmp_path / "app.css")
+
+    app = FastAPI()
+    app.mount("/static", PrecomputedStaticFiles(tmp_path), name="static")
+    return TestClient(app)
+
+
+class TestPrecomputedStaticFiles:
+    """Each response branch of the in-memory static app."""
+
+    def test_get_serves_file(self, static_client):
+        """GET returns the body with content type, length and an ETag."""
+        response = static_client.get("/static/app.css")
+
+        assert response.status_code == 200
+        assert response.content == CSS
+        assert response.headers["content-type"] == "text/css; charset=utf-8"
+        assert response.headers["content-length"] == str(len(CSS))
+        assert response.headers["etag"].startswith('"')
+
+    def test_serves_nested_and_binary_files(self, static_client):
+        """Nested paths resolve and unknown types fall back to octet-stream."""
+        assert static_client.get("/static/js/app.js").status_code == 200
+        response = static_client.get("/static/data.bin")
+        assert response.headers["content-type"] == "application/octet-stream"
+
+    def test_head_has_no_body_but_full_length(self, static_client):
+        """HEAD sends headers only, with the file's real content-length."""
+        response = static_client.head("/static/app.css")
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["content-length"] == str(len(CSS))
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        ["{etag}", "W/{etag}", '"other", {etag}', "*"],
+    )
+    def test_matching_etag_returns_304(self, static_client, if_none_match):
+        """If-None-Match with the current ETag (weak, listed or *) returns 304."""
+        etag = static_client.get("/static/app.css").headers["etag"]
+
+        response = static_client.get(
+            "/static/app.css",
+            headers={"If-None-Match": if_none_match.format(etag=etag)},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_returns_file(self, static_client):
+        """A non-matching ETag gets the full response."""
+        response = static_client.get(
+            "/static/app.css", headers={"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.content == CSS
+
+    def test_other_methods_return_405(self, static_client):
+        """Non-GET/HEAD methods are rejected with an Allow header."""
+        response = static_client.post("/static/app.css")
+
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET, HEAD"
+
+    @pytest.mark.parametrize("path", ["missing.css", "js", "link.css", ""])
+    def test_unknown_paths_return_404(self, static_client, path):
+        """Missing files, directories and symlinks are not served."""
+        assert static_client.get(f"/static/{path}").status_code == 404
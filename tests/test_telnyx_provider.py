@@ -0,0 +1,99 @@
+"""Tests for the Telnyx telephony provider.
+
+Run against a stand-in for the Telnyx async client.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.integrations.telnyx import provider as provider_module
+from app.integrations.telnyx.provider import TelnyxTelephonyProvider
+
+CALL = {
+    "to_number": "+15550000001",
+    "from_number": "+15550000002",
+    "webhook_url": "https://example.com/webhooks/telnyx",
+}
+
+
+class FakeCalls:
+    """calls resource stand-in; each dial returns a new call control ID."""
+
+    def __init__(self):
+        self.dials = 0
+        self.fail_next = False
+
+    async def dial(self, **kwargs) -> SimpleNamespace:
+        self.dials += 1
+        await asyncio.sleep(0.01)
+        if self.fail_next:
+            self.fail_next = False
+            raise ConnectionError("dial failed")
+        return SimpleNamespace(
+            data=SimpleNamespace(call_control_id=f"call-{self.dials}")
+        )
+
+
+@pytest.fixture
+def calls() -> FakeCalls:
+    """Provide the fake calls resource."""
+    return FakeCalls()
+
+
+@pytest.fixture
+def provider(calls) -> TelnyxTelephonyProvider:
+    """Provide a provider backed by the fake client."""
+    return TelnyxTelephonyProvider(client=SimpleNamespace(calls=calls))
+
+
+class TestInitiateCallIdempotency:
+    """Repeats of an idempotency key dial at most once."""
+
+    async def test_concurrent_repeats_share_one_dial(self, provider, calls):
+        """Concurrent calls with the same key await the same dial."""
+        ids = await asyncio.gather(
+            *(provider.initiate_call(**CALL, idempotency_key="k1") for _ in range(3))
+        )
+
+        assert ids == ["call-1"] * 3
+        assert calls.dials == 1
+
+    async def test_sequential_repeat_returns_dialed_call(self, provider, calls):
+        """A retry after the dial completed gets the same call instead of a new one."""
+        first = await provider.initiate_call(**CALL, idempotency_key="k1")
+        second = await provider.initiate_call(**CALL, idempotency_key="k1")
+
+        assert first == second == "call-1"
+        assert calls.dials == 1
+
+    async def test_distinct_keys_dial_separately(self, provider, calls):
+        """Different keys are different calls."""
+        await provider.initiate_call(**CALL, idempotency_key="k1")
+        await provider.initiate_call(**CALL, idempotency_key="k2")
+
+        assert calls.dials == 2
+
+    async def test_without_key_always_dials(self, provider, calls):
+        """Calls without a key are never deduplicated."""
+        await provider.initiate_call(**CALL)
+        await provider.initiate_call(**CALL)
+
+        assert calls.dials == 2
+
+    async def test_expired_key_dials_again(self, provider, calls, monkeypatch):
+        """Keys are only remembered for DIAL_IDEMPOTENCY_TTL."""
+        monkeypatch.setattr(provider_module, "DIAL_IDEMPOTENCY_TTL", 0.01)
+        await provider.initiate_call(**CALL, idempotency_key="k1")
+        await asyncio.sleep(0.02)
+
+        assert await provider.initiate_call(**CALL, idempotency_key="k1") == "call-2"
+
+    async def test_failed_dial_can_be_retried(self, provider, calls):
+        """A failed dial isn't remembered, so a retry dials again."""
+        calls.fail_next = True
+        with pytest.raises(ConnectionError):
+            await provider.initiate_call(**CALL, idempotency_key="k1")
+
+        assert await provider.initiate_call(**CALL, idempotency_key="k1") == "call-2"
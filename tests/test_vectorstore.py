@@ -0,0 +1,176 @@
+"""Vectorstore service tests.
+
+Run against an in-memory stand-in for the Qdrant client.
+"""
+
+import asyncio
+import importlib
+from types import SimpleNamespace
+
+import grpc
+import pytest
+from qdrant_client import models
+
+from app.lib.vectorstore import service
+from app.lib.vectorstore.service import VectorStore, _is_transient
+
+COLLECTION = "docs"
+QUERY = [0.1, 0.2]
+
+
+class FakeQdrantClient:
+    """Qdrant client stand-in; wait=False upserts stay unindexed until apply()."""
+
+    def __init__(self, **kwargs):
+        self.indexed: list[models.ScoredPoint] = []
+        self.unapplied: list[models.ScoredPoint] = []
+        self.queries = 0
+        self.batches: list[int] = []
+        self.error: Exception | None = None
+        self.gate: asyncio.Event | None = None
+
+    def apply(self) -> None:
+        self.indexed.extend(self.unapplied)
+        self.unapplied.clear()
+
+    async def upsert(self, collection_name, points, wait) -> models.UpdateResult:
+        scored = [models.ScoredPoint(id=p.id, version=0, score=1.0) for p in points]
+        (self.indexed if wait else self.unapplied).extend(scored)
+        return models.UpdateResult(operation_id=1, status=models.UpdateStatus.COMPLETED)
+
+    async def query_batch_points(
+        self, collection_name, requests
+    ) -> list[SimpleNamespace]:
+        self.batches.append(len(requests))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return [SimpleNamespace(points=[request.limit]) for request in requests]
+
+    async def query_points(self, **kwargs) -> SimpleNamespace:
+        self.queries += 1
+        snapshot = list(self.indexed)
+        if self.gate is not None:
+            await self.gate.wait()
+        return SimpleNamespace(points=snapshot)
+
+    async def close(self) -> None:
+        pass
+
+
+def _point(point_id: int) -> models.PointStruct:
+    return models.PointStruct(id=point_id, vector=QUERY)
+
+
+def _ids(points: list[models.ScoredPoint]) -> list:
+    return [p.id for p in points]
+
+
+@pytest.fixture
+async def store(monkeypatch):
+    """VectorStore backed by FakeQdrantClient."""
+    monkeypatch.setattr(service, "AsyncQdrantClient", FakeQdrantClient)
+    store = VectorStore(
+        url="http://qdrant.test", api_key="test", timeout=1, prefer_grpc=False
+    )
+    yield store
+    await store.close()
+
+
+class TestSearchCache:
+    """Cached search results never outlive a write to their collection."""
+
+    async def test_repeat_search_is_cached(self, store):
+        """Identical searches hit Qdrant once."""
+        await store.search(COLLECTION, QUERY)
+        await store.search(COLLECTION, QUERY)
+
+        assert store._client.queries == 1
+
+    async def test_write_then_search_sees_new_point(self, store):
+        """A waited upsert invalidates earlier results."""
+        assert await store.search(COLLECTION, QUERY) == []
+
+        await store.upsert(COLLECTION, [_point(1)])
+
+        assert _ids(await store.search(COLLECTION, QUERY)) == [1]
+
+    async def test_unapplied_write_is_not_cached(self, store):
+        """Results read while a wait=False write may be unindexed aren't cached."""
+        await store.search(COLLECTION, QUERY)
+        await store.upsert(COLLECTION, [_point(1)], wait=False)
+
+        assert await store.search(COLLECTION, QUERY) == []
+        store._client.apply()
+
+        assert _ids(await store.search(COLLECTION, QUERY)) == [1]
+
+    async def test_search_racing_write_is_not_cached(self, store):
+        """A search that read before a write completed doesn't cache its result."""
+        client = store._client
+        client.gate = asyncio.Event()
+        in_flight = asyncio.create_task(store.search(COLLECTION, QUERY))
+        await asyncio.sleep(0)
+
+        await store.upsert(COLLECTION, [_point(1)])
+        client.gate.set()
+        assert await in_flight == []
+
+        client.gate = None
+        assert _ids(await store.search(COLLECTION, QUERY)) == [1]
+
+
+def _rpc_error(code: grpc.StatusCode) -> grpc.aio.AioRpcError:
+    return grpc.aio.AioRpcError(code, grpc.aio.Metadata(), grpc.aio.Metadata())
+
+
+class TestTransientErrors:
+    """gRPC failures are classified like their HTTP equivalents."""
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            grpc.StatusCode.UNAVAILABLE,
+            grpc.StatusCode.DEADLINE_EXCEEDED,
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+        ],
+    )
+    def test_transient_grpc_codes(self, code):
+        """Unavailable, timed out and throttled calls are transient."""
+        assert _is_transient(_rpc_error(code))
+
+    def test_invalid_argument_is_permanent(self):
+        """A rejected request is never retried."""
+        assert not _is_transient(_rpc_error(grpc.StatusCode.INVALID_ARGUMENT))
+
+    async def test_grpc_failure_is_retried(self, store, monkeypatch):
+        """search retries an UNAVAILABLE error and returns the next attempt's points."""
+        retry_module = importlib.import_module("app.lib.utils.retry")
+        monkeypatch.setattr(retry_module, "_jittered", lambda delay: 0)
+        client = store._client
+        query_points = client.query_points
+        failures = [_rpc_error(grpc.StatusCode.UNAVAILABLE)]
+
+        async def flaky_query_points(**kwargs):
+            if failures:
+                raise failures.pop()
+            return await query_points(**kwargs)
+
+        client.query_points = flaky_query_points
+
+        assert await store.search(COLLECTION, QUERY) == []
+        assert client.queries == 1
+
+
+class TestSearchBatched:
+    """search_batched goes through the pooled client's batcher."""
+
+    async def test_concurrent_searches_share_one_request(self, store):
+        """Concurrent searches with different limits are sent as one batch."""
+        results = await asyncio.gather(
+            *(store.search_batched(COLLECTION, QUERY, limit=n) for n in (1, 2, 3))
+        )
+
+        assert results == [[1], [2], [3]]
+        assert store._client.batches == [3]